@@ -3,9 +3,13 @@
 Gradient utilities for the Frost Dune Background Generator.
 
 This module provides functions to:
-- Convert hex colors to / from float RGB triples.
-- Evaluate a GradientConfig (with up to 6 GradientStops).
-- Compute a per-pixel gradient parameter `t` in [0, 1] based on an angle.
+- Convert hex colors to / from float RGB triples (or a whole list of
+  colors to a uint8 array at once).
+- Expose a gradient's stops as parallel NumPy arrays.
+- Evaluate a GradientConfig (with up to 6 GradientStops) via a dense
+  lookup table.
+- Compute a per-pixel gradient parameter `t` in [0, 1] based on an angle
+  (or an explicit direction vector).
 - Map a `t`-field to an RGB image using the gradient.
 
 Conventions
@@ -17,7 +21,9 @@ Conventions
 
 from __future__ import annotations
 
-from typing import Tuple
+from functools import lru_cache
+from operator import itemgetter
+from typing import Optional, Sequence, Tuple
 
 import math
 import numpy as np
@@ -44,11 +50,44 @@ def HexToRgbFloat(hexColor: str) -> Tuple[float, float, float]:
     if len(hexColor) != 6:
         raise ValueError(f"Invalid hex color: {hexColor!r}")
 
-    r = int(hexColor[0:2], 16) / 255.0
-    g = int(hexColor[2:4], 16) / 255.0
-    b = int(hexColor[4:6], 16) / 255.0
+    try:
+        rgb = bytes.fromhex(hexColor)
+    except ValueError:
+        rgb = b""
 
-    return float(r), float(g), float(b)
+    # fromhex skips whitespace, so "0a  16" decodes to only 2 bytes
+    if len(rgb) != 3:
+        raise ValueError(f"Invalid hex color: {hexColor!r}")
+
+    return rgb[0] / 255.0, rgb[1] / 255.0, rgb[2] / 255.0
+
+
+def HexColorsToRgbUint8(hexColors: Sequence[str]) -> np.ndarray:
+    """Convert hex color strings (#rrggbb) to a (N, 3) uint8 array.
+
+    All colors are decoded by a single bytes.fromhex call on the joined
+    digits, instead of parsing each string separately.
+    """
+
+    digits = []
+    for hexColor in hexColors:
+        hexColor = hexColor.strip()
+        if hexColor.startswith("#"):
+            hexColor = hexColor[1:]
+        if len(hexColor) != 6:
+            raise ValueError(f"Invalid hex color: {hexColor!r}")
+        digits.append(hexColor)
+
+    try:
+        raw = bytes.fromhex("".join(digits))
+    except ValueError:
+        raw = b""
+
+    # fromhex skips whitespace, which would shift every later color
+    if len(raw) != 3 * len(digits):
+        raise ValueError(f"Invalid hex colors: {list(hexColors)!r}")
+
+    return np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3)
 
 
 def RgbFloatToUint8(r: np.ndarray, g: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -66,17 +105,124 @@ def RgbFloatToUint8(r: np.ndarray, g: np.ndarray, b: np.ndarray) -> Tuple[np.nda
 # ---------------------------------------------------------------------------
 
 
-def _SortStops(gradient: "GradientConfig") -> Tuple["GradientStop", ...]:
-    """Return the gradient's stops sorted by Position."""
+_StopKey = Tuple[Tuple[float, str, float], ...]
+
+
+def _MakeStopKey(gradient: "GradientConfig") -> _StopKey:
+    """Return a hashable snapshot of the gradient's stops.
+
+    The UI edits GradientConfig in place, so caches below are keyed by
+    the stop values rather than by object identity.
+    """
+
+    return tuple((float(s.Position), s.Color, float(s.Opacity)) for s in gradient.Stops)
+
+
+@lru_cache(maxsize=32)
+def _StopArraysFromKey(stopKey: _StopKey) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Build (positions, colors, opacities) arrays sorted by Position."""
+
+    stops = sorted(stopKey, key=itemgetter(0))
+
+    positions = np.array([s[0] for s in stops], dtype=np.float32)  # (N,)
+    # Divide in float64 before narrowing, exactly like HexToRgbFloat
+    colors = (HexColorsToRgbUint8([s[1] for s in stops]) / 255.0).astype(np.float32)  # (N, 3)
+    opacities = np.array([s[2] for s in stops], dtype=np.float32)  # (N,)
+
+    # Shared between callers via the cache: never modify in place
+    for arr in (positions, colors, opacities):
+        arr.setflags(write=False)
+
+    return positions, colors, opacities
+
+
+def GetStopArrays(gradient: "GradientConfig") -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the gradient's stops as parallel arrays, sorted by Position.
+
+    Returns
+    -------
+    (positions, colors, opacities)
+        Float32 arrays of shape (N,), (N, 3) and (N,). They are cached per
+        stop set and read-only.
+    """
+
+    return _StopArraysFromKey(_MakeStopKey(gradient))
+
+
+def BuildGradientLut(gradient: "GradientConfig", size: int = 1024) -> np.ndarray:
+    """Sample the gradient into a dense RGBA lookup table.
+
+    The stops are interpolated once over `size` evenly spaced positions
+    in [0, 1], so per-pixel evaluation becomes a single gather instead
+    of a search + lerp per channel. Tables are cached per stop set; the
+    returned array is read-only.
+
+    Returns
+    -------
+    np.ndarray
+        Float32 array of shape (size, 4) holding R, G, B, A in [0, 1].
+    """
+
+    return _LutFromKey(_MakeStopKey(gradient), max(2, int(size)))
+
+
+@lru_cache(maxsize=32)
+def _LutFromKey(stopKey: _StopKey, size: int) -> np.ndarray:
+    """Build the (size, 4) LUT for a stop snapshot (see BuildGradientLut)."""
+
+    positions, colors, opacities = _StopArraysFromKey(stopKey)
+    if positions.size == 0:
+        # Fallback: solid black
+        lut = np.zeros((size, 4), dtype=np.float32)
+        lut.setflags(write=False)
+        return lut
+
+    tAxis = np.linspace(0.0, 1.0, size, dtype=np.float32)
+
+    # Segment index of each t: the number of interior stops at or below
+    # it. With at most a handful of stops, a few compare+add passes beat
+    # a binary search per sample and cannot go out of range.
+    segments = np.zeros(size, dtype=np.intp)
+    for position in positions[1:-1]:
+        segments += tAxis >= position
 
-    stops = list(gradient.Stops)
-    stops.sort(key=lambda s: s.Position)
-    return tuple(stops)
+    # Left/right stop of each segment (both 0 for a single stop)
+    leftIndices = segments
+    rightIndices = np.minimum(segments + 1, len(positions) - 1)
+
+    leftPos = positions[leftIndices]
+    rightPos = positions[rightIndices]
+
+    # Before the first / after the last stop the colors are held, hence
+    # the clamp. Coincident stops have no span: pick the right stop once
+    # t has reached it.
+    denom = rightPos - leftPos
+    degenerate = denom == 0.0
+    denom[degenerate] = 1.0
+
+    factor = (tAxis - leftPos) / denom
+    np.clip(factor, 0.0, 1.0, out=factor)
+    factor[degenerate] = tAxis[degenerate] >= rightPos[degenerate]
+
+    # RGBA per stop, so all four channels are interpolated in one pass
+    stopRgba = np.column_stack((colors, opacities))  # shape: (N, 4)
+
+    leftRgba = stopRgba[leftIndices]  # shape: (size, 4)
+    rightRgba = stopRgba[rightIndices]
+
+    # lerp as left + f * (right - left), accumulated in place
+    lut = np.subtract(rightRgba, leftRgba, out=rightRgba)
+    lut *= factor[:, None]
+    lut += leftRgba
+
+    lut.setflags(write=False)
+    return lut
 
 
 def EvaluateGradientAt(
     gradient: "GradientConfig",
     t: np.ndarray,
+    lutSize: int = 1024,
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """Evaluate the gradient at each position in t.
 
@@ -85,63 +231,108 @@ def EvaluateGradientAt(
     gradient : GradientConfig
         Gradient configuration with up to 6 GradientStops.
     t : np.ndarray
-        Float32 array in [0, 1] specifying the gradient coordinate per pixel.
+        Float array in [0, 1] specifying the gradient coordinate per pixel
+        (float16 or float32; the index math is done in float32).
+    lutSize : int
+        Number of entries in the lookup table the gradient is sampled
+        into (see BuildGradientLut).
 
     Returns
     -------
     (r, g, b, a) : Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
-        Float32 arrays in [0, 1], each the same shape as t.
+        Float32 arrays in [0, 1], each the same shape as t. They are
+        channel views into a single (H, W, 4) buffer.
     """
 
     if t.ndim != 2:
         raise ValueError("t must be a 2D array")
 
-    stops = _SortStops(gradient)
-    if not stops:
-        # Fallback: solid black
-        shape = t.shape
-        zeros = np.zeros(shape, dtype=np.float32)
-        return zeros, zeros, zeros, zeros
+    lut = BuildGradientLut(gradient, lutSize)
+    rgba = _GatherLut(lut, t)  # shape: (*t.shape, 4)
+
+    return rgba[..., 0], rgba[..., 1], rgba[..., 2], rgba[..., 3]
+
+
+def EvaluateGradientAtU8(
+    gradient: "GradientConfig",
+    t: np.ndarray,
+    out: Optional[np.ndarray] = None,
+    lutSize: int = 1024,
+) -> np.ndarray:
+    """Evaluate the gradient at each position in t straight to uint8 RGBA.
 
-    # Pre-compute arrays of stop positions and colors
-    positions = np.array([s.Position for s in stops], dtype=np.float32)
-    colors = np.array([HexToRgbFloat(s.Color) for s in stops], dtype=np.float32)  # (N, 3)
-    opacities = np.array([s.Opacity for s in stops], dtype=np.float32)  # (N,)
+    Clamping, scaling to [0, 255] and the uint8 cast are baked into the
+    (cached) LUT, so the whole evaluation is one gather of 4 bytes per
+    pixel. The result matches EvaluateGradientAt followed by
+    RgbFloatToUint8.
 
-    # Clamp t to [0, 1]
-    tClamped = np.clip(t, 0.0, 1.0)
+    Parameters
+    ----------
+    gradient : GradientConfig
+        Gradient configuration with up to 6 GradientStops.
+    t : np.ndarray
+        2D float array in [0, 1] (see EvaluateGradientAt).
+    out : np.ndarray, optional
+        C-contiguous uint8 buffer of shape (*t.shape, 4) to write into.
+    lutSize : int
+        Number of entries in the lookup table.
 
-    # For each t, we find the surrounding stops: left index i, right index i+1
-    # np.searchsorted gives us the insertion index for each t
-    indices = np.searchsorted(positions, tClamped, side="right")
+    Returns
+    -------
+    np.ndarray
+        uint8 array of shape (H, W, 4); `out` if it was given. It can be
+        wrapped by Image.fromarray(..., "RGBA") without a copy.
+    """
 
-    # Left indices are one step to the left (but at least 0)
-    leftIndices = np.clip(indices - 1, 0, len(positions) - 1)
-    rightIndices = np.clip(indices, 0, len(positions) - 1)
+    if t.ndim != 2:
+        raise ValueError("t must be a 2D array")
 
-    leftPos = positions[leftIndices]
-    rightPos = positions[rightIndices]
+    lut = _LutU8FromKey(_MakeStopKey(gradient), max(2, int(lutSize)))
+    return _GatherLut(lut, t, out)
 
-    # Avoid division by zero: where leftPos == rightPos, set factor to 0
-    denom = rightPos - leftPos
-    denom[denom == 0.0] = 1.0
 
-    factor = (tClamped - leftPos) / denom
+def _GatherLut(lut: np.ndarray, t: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Gather the LUT entry of every t into a new (or the `out`) buffer.
+
+    A t that is broadcast along one axis (axis-aligned gradients, see
+    _ComputeGradientTCached) is looked up once for its single row or
+    column, which is then repeated; otherwise every pixel is gathered.
+    """
+
+    if t.strides[0] == 0 or t.strides[1] == 0:
+        line = t[:1] if t.strides[0] == 0 else t[:, :1]
+        lineValues = lut.take(_LutIndices(line, lut.shape[0]), axis=0, mode="clip")
+        if out is None:
+            out = np.empty(t.shape + lut.shape[1:], dtype=lut.dtype)
+        # Repeat whole entries (all channels as one opaque item); a plain
+        # broadcast copy of an (H, 1, 4) column moves 4 elements at a time
+        entry = np.dtype((np.void, lut.strides[0]))
+        np.copyto(out.view(entry)[..., 0], lineValues.view(entry)[..., 0])
+        return out
+
+    return lut.take(_LutIndices(t, lut.shape[0]), axis=0, mode="clip", out=out)
+
 
-    leftColors = colors[leftIndices]        # shape: (*t.shape, 3)
-    rightColors = colors[rightIndices]
+def _LutIndices(t: np.ndarray, size: int) -> np.ndarray:
+    """Map t to the nearest entry of a `size`-entry LUT.
 
-    leftAlpha = opacities[leftIndices]
-    rightAlpha = opacities[rightIndices]
+    The result is not clamped; gathers use mode="clip", which pins
+    out-of-range indices to the first/last entry.
+    """
+
+    # Single scratch buffer: scale and round in place, then cast
+    scaled = np.multiply(t, size - 1, dtype=np.float32)
+    scaled += 0.5
+    return scaled.astype(np.intp)
 
-    # Interpolate RGB and alpha
-    r = (1.0 - factor) * leftColors[..., 0] + factor * rightColors[..., 0]
-    g = (1.0 - factor) * leftColors[..., 1] + factor * rightColors[..., 1]
-    b = (1.0 - factor) * leftColors[..., 2] + factor * rightColors[..., 2]
 
-    a = (1.0 - factor) * leftAlpha + factor * rightAlpha
+@lru_cache(maxsize=32)
+def _LutU8FromKey(stopKey: _StopKey, size: int) -> np.ndarray:
+    """uint8 version of _LutFromKey (same rounding as RgbFloatToUint8)."""
 
-    return r.astype(np.float32), g.astype(np.float32), b.astype(np.float32), a.astype(np.float32)
+    lut = (np.clip(_LutFromKey(stopKey, size), 0.0, 1.0) * 255.0).astype(np.uint8)
+    lut.setflags(write=False)
+    return lut
 
 
 # ---------------------------------------------------------------------------
@@ -153,6 +344,7 @@ def ComputeGradientTFromAngle(
     width: int,
     height: int,
     angleDeg: float,
+    dtype: "np.typing.DTypeLike" = np.float32,
 ) -> np.ndarray:
     """Compute a 2D field `t` in [0, 1] along a gradient axis.
 
@@ -161,49 +353,145 @@ def ComputeGradientTFromAngle(
     - 90° = bottom -> top
 
     Implementation details:
-    - We create normalized coordinates (xNorm, yNorm) in [0, 1].
+    - We create normalized coordinate axes (xs, ys) in [0, 1].
     - We shift them so the center is (0, 0).
     - We project the coordinates onto a unit direction vector derived
-      from angleDeg.
+      from angleDeg (see GradientDirectionFromAngle).
     - The result is remapped to [0, 1].
+
+    The math is done in float32; `dtype` only selects the storage type of
+    the result. np.float16 is sufficient when `t` merely indexes the
+    gradient LUT and halves the memory traffic of that gather.
+
+    Results up to preview/4K size are cached per (width, height,
+    direction, dtype), since previews re-render the same field
+    repeatedly. The returned array is read-only. For axis-aligned
+    angles (multiples of 90°) it is a broadcast view of a single row or
+    column.
     """
 
-    # Normalized coordinate grid in [0, 1]
-    ys = np.linspace(0.0, 1.0, height, dtype=np.float32)
-    xs = np.linspace(0.0, 1.0, width, dtype=np.float32)
-    xNorm, yNorm = np.meshgrid(xs, ys)
+    dirX, dirY = GradientDirectionFromAngle(angleDeg)
+    return ComputeGradientTFromDirection(width, height, dirX, dirY, dtype=dtype)
+
 
-    # Center the coordinates around (0, 0)
-    xCentered = xNorm - 0.5
-    yCentered = yNorm - 0.5
+# Direction components below this count as zero (axis-aligned gradient)
+_AxisEpsilon = 1e-9
 
-    # Angle in radians
-    angleRad = math.radians(float(angleDeg))
+
+@lru_cache(maxsize=64)
+def _DirectionFromAngleCached(angleDeg: float) -> Tuple[float, float]:
+    """Uncached body of GradientDirectionFromAngle."""
+
+    angleRad = math.radians(angleDeg)
 
     # Direction vector: 0° -> +X, 90° -> +Y (bottom), but we want 90° to
     # correspond to bottom->top, so we invert the Y part
-    dirX = math.cos(angleRad)
-    dirY = -math.sin(angleRad)
+    return math.cos(angleRad), -math.sin(angleRad)
+
+
+def GradientDirectionFromAngle(angleDeg: float) -> Tuple[float, float]:
+    """Return the (dirX, dirY) screen-space direction for a gradient angle.
+
+    Uses the angle convention of ComputeGradientTFromAngle. The handful
+    of angles a session uses are memoized, so callers can convert once
+    and pass the vector to ComputeGradientTFromDirection.
+    """
+
+    return _DirectionFromAngleCached(float(angleDeg))
+
+
+def ComputeGradientTFromDirection(
+    width: int,
+    height: int,
+    dirX: float,
+    dirY: float,
+    dtype: "np.typing.DTypeLike" = np.float32,
+) -> np.ndarray:
+    """Compute the `t` field for an explicit direction vector.
+
+    Same as ComputeGradientTFromAngle, but skips the angle -> vector
+    conversion. (dirX, dirY) is in screen space (Y grows down) and does
+    not need to be normalized. The returned array is read-only and,
+    up to _GradientTCacheMaxBytes, cached.
+    """
+
+    args = (int(width), int(height), float(dirX), float(dirY), np.dtype(dtype))
+    if args[0] * args[1] * args[4].itemsize > _GradientTCacheMaxBytes:
+        # Export-sized fields are not kept alive by the cache
+        return _ComputeGradientTCached.__wrapped__(*args)
+    return _ComputeGradientTCached(*args)
+
+
+# Largest t-field kept by _ComputeGradientTCached (a 4K float32 field is
+# ~32 MB), which bounds the cache to a few hundred MB at most
+_GradientTCacheMaxBytes = 32 * 1024 * 1024
+
+
+@lru_cache(maxsize=8)
+def _ComputeGradientTCached(
+    width: int,
+    height: int,
+    dirX: float,
+    dirY: float,
+    dtype: np.dtype,
+) -> np.ndarray:
+    """Uncached body of ComputeGradientTFromDirection."""
+
+    # Normalized coordinate axes in [0, 1]
+    ys = np.linspace(0.0, 1.0, height, dtype=np.float32)
+    xs = np.linspace(0.0, 1.0, width, dtype=np.float32)
+
+    # Center the coordinates around (0, 0). Kept as a (1, W) row and an
+    # (H, 1) column; broadcasting forms the (H, W) grid in the projection.
+    xCentered = (xs - 0.5)[None, :]
+    yCentered = (ys - 0.5)[:, None]
 
     # Normalize direction vector (safety)
     length = math.sqrt(dirX * dirX + dirY * dirY) or 1.0
     dirX /= length
     dirY /= length
 
-    # Projection of each pixel onto the direction vector
-    proj = xCentered * dirX + yCentered * dirY
+    # cos/sin leave ~1e-17 residue at 0°/90°/180°/270°; snap it so those
+    # directions take the axis-aligned path below
+    if abs(dirX) < _AxisEpsilon:
+        dirX = 0.0
+    if abs(dirY) < _AxisEpsilon:
+        dirY = 0.0
+
+    # Projection onto the direction vector, split per axis. proj is
+    # linear in x and y, so its extrema over the grid are the sums of the
+    # per-axis extrema, which sit at the first/last sample of each axis.
+    projX = xCentered * dirX  # (1, W)
+    projY = yCentered * dirY  # (H, 1)
 
-    # proj is roughly in [-0.5 * sqrt(2), 0.5 * sqrt(2)] for angles, but
-    # we can remap linearly by finding min/max for this grid.
-    minProj = float(proj.min())
-    maxProj = float(proj.max())
+    minProj = min(projX[0, 0], projX[0, -1]) + min(projY[0, 0], projY[-1, 0])
+    maxProj = max(projX[0, 0], projX[0, -1]) + max(projY[0, 0], projY[-1, 0])
+    minProj = float(minProj)
+    maxProj = float(maxProj)
 
     if maxProj <= minProj + 1e-8:
         # Degenerate case (should not happen), fallback to zeros
-        return np.zeros_like(proj, dtype=np.float32)
-
-    t = (proj - minProj) / (maxProj - minProj)
-    return t.astype(np.float32)
+        t = np.zeros((height, width), dtype=dtype)
+        t.setflags(write=False)
+        return t
+
+    # Remap to [0, 1] on the 1D axes; the only (H, W) pass is the final sum
+    scale = 1.0 / (maxProj - minProj)
+    projX = (projX - minProj) * scale
+    projY = projY * scale
+
+    # Axis-aligned: t is constant along one axis, so only that axis is
+    # computed and returned as a broadcast (H, W) view (see _GatherLut)
+    if dirY == 0.0:
+        line = (projX + projY[:1]).astype(dtype, copy=False)  # (1, W)
+        return np.broadcast_to(line, (height, width))
+    if dirX == 0.0:
+        line = (projX[:, :1] + projY).astype(dtype, copy=False)  # (H, 1)
+        return np.broadcast_to(line, (height, width))
+
+    t = (projX + projY).astype(dtype, copy=False)
+    t.setflags(write=False)
+    return t
 
 
 # ---------------------------------------------------------------------------
@@ -17,7 +17,12 @@ Naming follows a C#-like style (PascalCase for classes and methods).
 
 from __future__ import annotations
 
-from typing import Tuple, List
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import astuple
+from functools import lru_cache
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 import numpy as np
 
@@ -25,7 +30,7 @@ try:
     # When used in a package layout
     from model.project_config import ProjectConfig
     from model.noise_layer import NoiseLayerConfig, NoiseLayerType
-    from core.noise import GenerateFbmRidge, CombineWarpLayers
+    from core.noise import GenerateFbmRidge, CombineWarpLayers, ApplyPowerInPlace
 except ImportError:  # pragma: no cover - fallback for single-file prototyping
     # Assume the symbols are available in the global namespace when all
     # code is placed into a single file during early experimentation.
@@ -45,36 +50,134 @@ def BuildCoordinateGrid(width: int, height: int) -> Tuple[np.ndarray, np.ndarray
     The returned arrays have shape (height, width) and can be used as
     input to the noise functions. X increases left-to-right, Y increases
     top-to-bottom.
+
+    Both grids are read-only broadcast views of the 1D axes (see
+    BuildCoordinateAxes), so no (height, width) buffers are allocated.
+    They are cached per size.
+    """
+
+    return _BuildCoordinateGridCached(int(width), int(height))
+
+
+@lru_cache(maxsize=8)
+def _BuildCoordinateGridCached(width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Uncached body of BuildCoordinateGrid."""
+
+    xs, ys = BuildCoordinateAxes(width, height)
+
+    baseX = np.broadcast_to(xs[None, :], (height, width))
+    baseY = np.broadcast_to(ys[:, None], (height, width))
+    return baseX, baseY
+
+
+def BuildCoordinateAxes(width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Build the normalized 1D coordinate axes (xs, ys) in [0, 1].
+
+    xs has shape (width,), ys has shape (height,). The axes are cached
+    per size and shared, so they are read-only.
     """
 
+    return _BuildCoordinateAxesCached(int(width), int(height))
+
+
+@lru_cache(maxsize=8)
+def _BuildCoordinateAxesCached(width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Uncached body of BuildCoordinateAxes."""
+
     # Note: use float32 to keep memory and performance reasonable.
-    ys = np.linspace(0.0, 1.0, height, dtype=np.float32)
     xs = np.linspace(0.0, 1.0, width, dtype=np.float32)
+    ys = np.linspace(0.0, 1.0, height, dtype=np.float32)
 
-    baseX, baseY = np.meshgrid(xs, ys)
-    return baseX, baseY
+    xs.setflags(write=False)
+    ys.setflags(write=False)
+    return xs, ys
 
 
 # ---------------------------------------------------------------------------
-# Heightmap Construction
+# Noise Field Cache
 # ---------------------------------------------------------------------------
 
+# Warp coordinates and per-layer FBM fields keyed by the parameter values
+# they depend on, so re-rendering after changing one layer (or only a
+# layer's HeightPower/Amplitude, or the lighting/gradient) reuses every
+# unaffected field. Bounded by total size, least recently used first out.
+_FieldCacheMaxBytes = 256 * 1024 * 1024
+# Largest single entry (a 4K warp coordinate pair still fits)
+_FieldCacheMaxEntryBytes = _FieldCacheMaxBytes // 4
+_FieldCache: "OrderedDict[Hashable, Tuple[np.ndarray, ...]]" = OrderedDict()
+_FieldCacheLock = threading.Lock()
 
-def _SplitNoiseLayers(
-    layers: List["NoiseLayerConfig"],
-) -> Tuple[List["NoiseLayerConfig"], List["NoiseLayerConfig"]]:
-    """Split a list of layers into (warpLayers, nonWarpLayers)."""
 
-    warpLayers: List[NoiseLayerConfig] = []
-    nonWarpLayers: List[NoiseLayerConfig] = []
+def _FieldCacheGet(key: Hashable) -> Optional[Tuple[np.ndarray, ...]]:
+    """Return the cached arrays for key (read-only), or None."""
 
-    for layer in layers:
-        if layer.LayerType is NoiseLayerType.Warp:
-            warpLayers.append(layer)
-        else:
-            nonWarpLayers.append(layer)
+    with _FieldCacheLock:
+        value = _FieldCache.get(key)
+        if value is not None:
+            _FieldCache.move_to_end(key)
+        return value
 
-    return warpLayers, nonWarpLayers
+
+def _FieldCachePut(key: Hashable, value: Tuple[np.ndarray, ...]) -> None:
+    """Store arrays under key, marking them read-only.
+
+    Entries above _FieldCacheMaxEntryBytes (large exports) are not
+    stored, so they neither stay alive after the render nor evict the
+    preview's fields.
+    """
+
+    if sum(arr.nbytes for arr in value) > _FieldCacheMaxEntryBytes:
+        return
+
+    for arr in value:
+        arr.setflags(write=False)
+
+    with _FieldCacheLock:
+        _FieldCache[key] = value
+        _FieldCache.move_to_end(key)
+
+        totalBytes = sum(arr.nbytes for entry in _FieldCache.values() for arr in entry)
+        while totalBytes > _FieldCacheMaxBytes:
+            _, evicted = _FieldCache.popitem(last=False)
+            totalBytes -= sum(arr.nbytes for arr in evicted)
+
+
+def _WarpKey(warpLayers: List["NoiseLayerConfig"]) -> Tuple[Any, ...]:
+    """Hashable snapshot of the warp layers that actually displace.
+
+    Disabled and zero-amplitude layers are left out: they add nothing, so
+    a setup made only of those keeps the unwarped (separable) axes.
+    """
+
+    return tuple(
+        astuple(layer)
+        for layer in warpLayers
+        if layer.Enabled and abs(float(layer.Amplitude)) >= 1e-9
+    )
+
+
+def _FbmKey(layer: "NoiseLayerConfig") -> Tuple[Any, ...]:
+    """Hashable snapshot of the fields GenerateFbmRidge depends on.
+
+    HeightPower and Amplitude are applied afterwards and left out, so
+    tweaking them does not regenerate the noise.
+    """
+
+    return (
+        layer.LayerType,
+        int(layer.Seed),
+        float(layer.ScaleX),
+        float(layer.ScaleY),
+        int(layer.Octaves),
+        float(layer.Persistence),
+        float(layer.Lacunarity),
+        float(layer.RidgePower),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Heightmap Construction
+# ---------------------------------------------------------------------------
 
 
 def _BuildWarpField(
@@ -89,72 +192,177 @@ def _BuildWarpField(
     """
 
     if not warpLayers:
-        zerosX = np.zeros_like(baseX, dtype=np.float32)
-        zerosY = np.zeros_like(baseY, dtype=np.float32)
+        gridShape = np.broadcast_shapes(baseX.shape, baseY.shape)
+        zerosX = np.zeros(gridShape, dtype=np.float32)
+        zerosY = np.zeros(gridShape, dtype=np.float32)
         return zerosX, zerosY
 
     wxTotal, wyTotal = CombineWarpLayers(warpLayers, baseX, baseY)
     return wxTotal, wyTotal
 
 
+def _WarpCoordinates(
+    warpLayers: List["NoiseLayerConfig"],
+    baseX: np.ndarray,
+    baseY: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the domain-warped coordinates (warpedX, warpedY).
+
+    Without active warp layers the (1, W) / (H, 1) axes are returned as
+    they are, so the noise stays separable and cheap to evaluate.
+    Otherwise the (read-only) result is cached per warp setup and size.
+    """
+
+    warpKey = _WarpKey(warpLayers)
+    if not warpKey:
+        return baseX, baseY
+
+    cacheKey = ("warp", warpKey, baseX.shape, baseY.shape)
+    cached = _FieldCacheGet(cacheKey)
+    if cached is not None:
+        return cached[0], cached[1]
+
+    wxTotal, wyTotal = _BuildWarpField(warpLayers, baseX, baseY)
+
+    # The warp offsets are fresh (H, W) buffers; turn them into the
+    # warped coordinates in place (the axes are shared and read-only).
+    warpedX = np.add(wxTotal, baseX, out=wxTotal)
+    warpedY = np.add(wyTotal, baseY, out=wyTotal)
+
+    _FieldCachePut(cacheKey, (warpedX, warpedY))
+    return warpedX, warpedY
+
+
+def _BuildCoordinateAxes2D(width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the coordinate axes as a (1, W) row and an (H, 1) column.
+
+    They broadcast to the full (H, W) grid wherever they are combined, so
+    per-octave frequency scaling only touches W + H values.
+    """
+
+    xs, ys = BuildCoordinateAxes(width, height)
+    return xs[None, :], ys[:, None]
+
+
 def _EvaluateNonWarpLayers(
     layers: List["NoiseLayerConfig"],
     warpedX: np.ndarray,
     warpedY: np.ndarray,
+    coordKey: Optional[Hashable] = None,
+    keepLayerMaps: bool = True,
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """Evaluate all BASE/DETAIL layers on the warped coordinates.
 
+    The coordinates may be (1, W) / (H, 1) axes (see
+    _BuildCoordinateAxes2D); the maps always have the full grid shape.
+
+    If `coordKey` identifies the coordinates (warp setup + size), each
+    layer's FBM field is cached under it and reused by later calls.
+
     Returns three heightmaps:
     - baseMap: sum of all BASE layers (before normalization),
     - detailMap: sum of all DETAIL layers (before normalization),
     - combinedMap: sum of both (before normalization).
 
     Layer-specific HeightPower and Amplitude are applied.
-    """
-
-    baseMap = np.zeros_like(warpedX, dtype=np.float32)
-    detailMap = np.zeros_like(warpedX, dtype=np.float32)
-
-    for layer in layers:
-        if not layer.Enabled:
-            continue
 
-        if layer.LayerType not in (NoiseLayerType.Base, NoiseLayerType.Detail):
-            continue
-
-        layerHeight = GenerateFbmRidge(layer, warpedX, warpedY)
+    With `keepLayerMaps=False` the combined map is summed into the base
+    map's buffer, so baseMap must not be used afterwards.
+    """
 
-        # Apply per-layer height shaping
-        heightPower = float(layer.HeightPower)
-        if heightPower != 1.0:
-            layerHeight = np.power(layerHeight, heightPower, dtype=np.float32)
+    gridShape = np.broadcast_shapes(warpedX.shape, warpedY.shape)
+
+    activeLayers = [
+        layer
+        for layer in layers
+        if layer.Enabled and layer.LayerType in (NoiseLayerType.Base, NoiseLayerType.Detail)
+    ]
+
+    # Cached fields first; only the missing ones are generated
+    cacheKeys: List[Optional[Hashable]] = [
+        ("fbm", coordKey, _FbmKey(layer)) if coordKey is not None else None
+        for layer in activeLayers
+    ]
+    layerHeights: List[Optional[np.ndarray]] = []
+    for key in cacheKeys:
+        cached = None if key is None else _FieldCacheGet(key)
+        layerHeights.append(None if cached is None else cached[0])
+    missing = [index for index, field in enumerate(layerHeights) if field is None]
+
+    # Layers are independent, so their FBM fields are generated
+    # concurrently (NumPy releases the GIL inside its array loops). The
+    # results are shaped and summed below in layer order, which keeps the
+    # output deterministic.
+    def Generate(index: int) -> np.ndarray:
+        return GenerateFbmRidge(activeLayers[index], warpedX, warpedY)
+
+    if len(missing) > 1:
+        with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+            generated = list(executor.map(Generate, missing))
+    else:
+        generated = [Generate(index) for index in missing]
+
+    for index, field in zip(missing, generated):
+        layerHeights[index] = field
+        if cacheKeys[index] is not None:
+            _FieldCachePut(cacheKeys[index], (field,))
+
+    # Shape each layer in one scratch buffer and add it straight into its
+    # accumulator; the first layer of a type initializes it instead of
+    # being added to zeros. Per-type sums are kept in layer order, so the
+    # result matches summing every layer into its own map.
+    maps: Dict[NoiseLayerType, np.ndarray] = {}
+    scratch: Optional[np.ndarray] = None
+
+    for layer, field in zip(activeLayers, layerHeights):
+        target = maps.get(layer.LayerType)
+        if target is None:
+            # Copy (the field may be cached) straight into the new map
+            target = maps[layer.LayerType] = np.array(field, dtype=np.float32)
+            layerHeight = target
+        else:
+            if scratch is None:
+                scratch = np.empty(gridShape, dtype=np.float32)
+            np.copyto(scratch, field)
+            layerHeight = scratch
 
-        # Apply layer amplitude
+        ApplyPowerInPlace(layerHeight, layer.HeightPower)
         layerHeight *= float(layer.Amplitude)
 
-        if layer.LayerType is NoiseLayerType.Base:
-            baseMap += layerHeight
-        elif layer.LayerType is NoiseLayerType.Detail:
-            detailMap += layerHeight
+        if layerHeight is scratch:
+            np.add(target, scratch, out=target)
 
-    combinedMap = baseMap + detailMap
+    baseMap = maps.get(NoiseLayerType.Base)
+    detailMap = maps.get(NoiseLayerType.Detail)
+    if baseMap is None:
+        baseMap = np.zeros(gridShape, dtype=np.float32)
+    if detailMap is None:
+        detailMap = np.zeros(gridShape, dtype=np.float32)
+
+    if keepLayerMaps:
+        combinedMap = baseMap + detailMap
+    else:
+        combinedMap = np.add(baseMap, detailMap, out=baseMap)
     return baseMap, detailMap, combinedMap
 
 
 def _NormalizeHeightmap(heightmap: np.ndarray) -> np.ndarray:
-    """Normalize a heightmap to the [0, 1] range.
+    """Normalize a float32 heightmap to the [0, 1] range in place.
 
-    If the map is constant, returns zeros.
+    Returns the (now normalized) input array. If the map is constant,
+    it is filled with zeros.
     """
 
     minVal = float(heightmap.min())
     maxVal = float(heightmap.max())
 
     if maxVal <= minVal + 1e-8:
-        return np.zeros_like(heightmap, dtype=np.float32)
+        heightmap.fill(0.0)
+        return heightmap
 
-    normalized = (heightmap - minVal) / (maxVal - minVal)
-    return normalized.astype(np.float32)
+    np.subtract(heightmap, minVal, out=heightmap)
+    np.multiply(heightmap, 1.0 / (maxVal - minVal), out=heightmap)
+    return heightmap
 
 
 def BuildHeightmap(
@@ -169,23 +377,24 @@ def BuildHeightmap(
     if you need those for previews.
 
     Steps:
-    - Build coordinate grid in [0, 1].
+    - Build coordinate axes in [0, 1].
     - Combine all WARP layers -> warp field.
     - Distort coordinates.
     - Evaluate BASE + DETAIL layers.
     - Normalize combined heightmap to [0, 1].
     """
 
-    baseX, baseY = BuildCoordinateGrid(width, height)
+    baseX, baseY = _BuildCoordinateAxes2D(width, height)
 
-    warpLayers, nonWarpLayers = _SplitNoiseLayers(projectConfig.NoiseLayers)
+    warpLayers = projectConfig.WarpLayers
+    nonWarpLayers = projectConfig.NonWarpLayers
 
-    wxTotal, wyTotal = _BuildWarpField(warpLayers, baseX, baseY)
+    warpedX, warpedY = _WarpCoordinates(warpLayers, baseX, baseY)
+    coordKey = (_WarpKey(warpLayers), int(width), int(height))
 
-    warpedX = baseX + wxTotal
-    warpedY = baseY + wyTotal
-
-    _, _, combinedMap = _EvaluateNonWarpLayers(nonWarpLayers, warpedX, warpedY)
+    _, _, combinedMap = _EvaluateNonWarpLayers(
+        nonWarpLayers, warpedX, warpedY, coordKey, keepLayerMaps=False
+    )
 
     normalized = _NormalizeHeightmap(combinedMap)
     return normalized
@@ -212,16 +421,15 @@ def BuildHeightmapWithLayerMaps(
         for clarity in previews).
     """
 
-    baseX, baseY = BuildCoordinateGrid(width, height)
-    warpLayers, nonWarpLayers = _SplitNoiseLayers(projectConfig.NoiseLayers)
-
-    wxTotal, wyTotal = _BuildWarpField(warpLayers, baseX, baseY)
+    baseX, baseY = _BuildCoordinateAxes2D(width, height)
+    warpLayers = projectConfig.WarpLayers
+    nonWarpLayers = projectConfig.NonWarpLayers
 
-    warpedX = baseX + wxTotal
-    warpedY = baseY + wyTotal
+    warpedX, warpedY = _WarpCoordinates(warpLayers, baseX, baseY)
+    coordKey = (_WarpKey(warpLayers), int(width), int(height))
 
     baseMap, detailMap, combinedMap = _EvaluateNonWarpLayers(
-        nonWarpLayers, warpedX, warpedY
+        nonWarpLayers, warpedX, warpedY, coordKey
     )
 
     baseMapNorm = _NormalizeHeightmap(baseMap)
@@ -16,6 +16,7 @@ Conventions
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Tuple
 
 import math
@@ -53,24 +54,66 @@ def ComputeNormals(height: np.ndarray, scaleZ: float = 1.0) -> Tuple[np.ndarray,
     if height.ndim != 2:
         raise ValueError("height must be a 2D array")
 
-    # Pad the heightmap at the border to avoid dealing with edges separately
-    pad = np.pad(height, 1, mode="edge")
+    dx, dy, invLength = _HeightGradient(height, scaleZ)
 
-    # Central differences in X and Y (note that Y is rows, X is columns)
-    dx = pad[1:-1, 2:] - pad[1:-1, :-2]
-    dy = pad[2:, 1:-1] - pad[:-2, 1:-1]
+    # Normalize the normal vectors (in place, reusing the gradient buffers)
+    nx = np.negative(dx, out=dx)
+    nx *= invLength
+    ny = np.negative(dy, out=dy)
+    ny *= invLength
+    nz = np.multiply(invLength, np.float32(scaleZ), out=invLength)
 
-    nx = -dx
-    ny = -dy
-    nz = np.ones_like(height, dtype=np.float32) * float(scaleZ)
+    return nx, ny, nz
 
-    # Normalize the normal vectors
-    length = np.sqrt(nx * nx + ny * ny + nz * nz) + 1e-8
-    nx = nx / length
-    ny = ny / length
-    nz = nz / length
 
-    return nx.astype(np.float32), ny.astype(np.float32), nz.astype(np.float32)
+def _HeightGradient(
+    height: np.ndarray,
+    scaleZ: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (dx, dy, invLength) for the unnormalized normals of height.
+
+    The unnormalized normal is (-dx, -dy, scaleZ) and invLength is the
+    reciprocal of its length. All three are fresh float32 buffers.
+    """
+
+    height = np.asarray(height, dtype=np.float32)
+
+    # Central differences in X and Y (note that Y is rows, X is columns),
+    # written straight into the gradient buffers. At the border the
+    # missing neighbour is replaced by the edge pixel itself (same as
+    # edge-padding), which turns into a one-sided difference there.
+    dx = _CentralDifference(height, axis=1)
+    dy = _CentralDifference(height, axis=0)
+
+    # 1 / |(-dx, -dy, scaleZ)|, computed once and shared by all components
+    scaleZ = np.float32(scaleZ)
+    invLength = dx * dx
+    invLength += dy * dy
+    invLength += scaleZ * scaleZ
+    np.sqrt(invLength, out=invLength)
+    invLength += 1e-8
+    np.reciprocal(invLength, out=invLength)
+
+    return dx, dy, invLength
+
+
+def _CentralDifference(height: np.ndarray, axis: int) -> np.ndarray:
+    """Edge-clamped central difference of a 2D float32 map along `axis`."""
+
+    diff = np.empty_like(height)
+
+    # Bring `axis` to the front as a view, so both directions share code
+    src = np.moveaxis(height, axis, 0)
+    out = np.moveaxis(diff, axis, 0)
+
+    if src.shape[0] < 2:
+        out.fill(0.0)
+        return diff
+
+    np.subtract(src[2:], src[:-2], out=out[1:-1])
+    np.subtract(src[1], src[0], out=out[0])
+    np.subtract(src[-1], src[-2], out=out[-1])
+    return diff
 
 
 # ---------------------------------------------------------------------------
@@ -88,11 +131,19 @@ def BuildLightVector(config: "LightingConfig") -> Tuple[float, float, float]:
     - Elevation 0°: light is in the plane.
     - Elevation 90°: light is straight from above (+Z).
 
-    The vector is normalized to length 1.
+    The vector has unit length by construction (cos²el·(cos²az + sin²az)
+    + sin²el = 1), so no extra normalization is needed.
     """
 
-    az = math.radians(float(config.LightAzimuthDeg))
-    el = math.radians(float(config.LightElevationDeg))
+    return _LightVectorCached(float(config.LightAzimuthDeg), float(config.LightElevationDeg))
+
+
+@lru_cache(maxsize=64)
+def _LightVectorCached(azimuthDeg: float, elevationDeg: float) -> Tuple[float, float, float]:
+    """Uncached body of BuildLightVector, memoized by the angle values."""
+
+    az = math.radians(azimuthDeg)
+    el = math.radians(elevationDeg)
 
     # Standard spherical coordinates mapping:
     # x = cos(el) * cos(az)
@@ -102,10 +153,7 @@ def BuildLightVector(config: "LightingConfig") -> Tuple[float, float, float]:
     ly = math.cos(el) * math.sin(az)
     lz = math.sin(el)
 
-    # Normalize for safety (should already be unit length)
-    length = math.sqrt(lx * lx + ly * ly + lz * lz) or 1.0
-
-    return (lx / length, ly / length, lz / length)
+    return (lx, ly, lz)
 
 
 # ---------------------------------------------------------------------------
@@ -149,31 +197,13 @@ def ComputeShade(
 
     lx, ly, lz = lightVector
 
-    # Dot product between normal and light direction
-    dot = nx * lx + ny * ly + nz * lz
+    # Dot product between normal and light direction, accumulated in a
+    # single float32 buffer that then becomes the shade map
+    dot = np.multiply(nx, lx, dtype=np.float32)
+    dot += ny * ly
+    dot += nz * lz
 
-    # Keep only the lit side; clamp to [0, 1]
-    shade = np.clip(dot, 0.0, 1.0)
-
-    # Apply global intensity
-    intensity = float(intensity)
-    if intensity < 0.0:
-        intensity = 0.0
-    if intensity > 1.0:
-        intensity = 1.0
-
-    shade *= intensity
-
-    # Map to [minBrightness, maxBrightness]
-    minB = float(minBrightness)
-    maxB = float(maxBrightness)
-
-    if maxB < minB:
-        maxB, minB = minB, maxB
-
-    shade = minB + (maxB - minB) * shade
-
-    return shade.astype(np.float32)
+    return _MapDotToShade(dot, intensity, minBrightness, maxBrightness)
 
 
 def ComputeShadeFromHeightmap(
@@ -190,20 +220,56 @@ def ComputeShadeFromHeightmap(
     - Build the light vector from LightingConfig.
     - Compute the shade/brightness map.
 
+    The normals are never materialized: the light vector is dotted with
+    the unnormalized normal (-dx, -dy, scaleZ) and scaled by 1/length
+    afterwards, all in the gradient buffers. The result equals
+    ComputeShade(*ComputeNormals(height, scaleZ), ...) up to rounding.
+
     Returns a float32 array in [minBrightness, maxBrightness].
     """
 
-    nx, ny, nz = ComputeNormals(height, scaleZ=scaleZ)
-    lightVector = BuildLightVector(lightingConfig)
+    if height.ndim != 2:
+        raise ValueError("height must be a 2D array")
+
+    lx, ly, lz = BuildLightVector(lightingConfig)
+    lzScaled = float(scaleZ) * lz  # constant z term of the dot product
+    dx, dy, invLength = _HeightGradient(height, scaleZ)
+
+    # dot(n, l) = (-dx * lx - dy * ly + scaleZ * lz) / length
+    dot = np.multiply(dx, -lx, out=dx)
+    dy *= -ly
+    dot += dy
+    dot += lzScaled
+    dot *= invLength
+
+    return _MapDotToShade(dot, lightingConfig.Intensity, minBrightness, maxBrightness)
+
+
+def _MapDotToShade(
+    dot: np.ndarray,
+    intensity: float,
+    minBrightness: float,
+    maxBrightness: float,
+) -> np.ndarray:
+    """Turn N·L values into brightness in place (see ComputeShade).
+
+    `dot` must be a float32 buffer owned by the caller; it is returned.
+    """
+
+    # Keep only the lit side; clamp to [0, 1]
+    shade = np.clip(dot, 0.0, 1.0, out=dot)
+
+    # Apply global intensity
+    intensity = min(max(float(intensity), 0.0), 1.0)
+    shade *= intensity
 
-    shade = ComputeShade(
-        nx,
-        ny,
-        nz,
-        lightVector,
-        intensity=lightingConfig.Intensity,
-        minBrightness=minBrightness,
-        maxBrightness=maxBrightness,
-    )
+    # Map to [minBrightness, maxBrightness]
+    minB = float(minBrightness)
+    maxB = float(maxBrightness)
+
+    if maxB < minB:
+        maxB, minB = minB, maxB
 
+    shade *= maxB - minB
+    shade += minB
     return shade
\ No newline at end of file
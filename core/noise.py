@@ -3,7 +3,9 @@
 Noise utilities for the Frost Dune Background Generator.
 
 This module provides:
+- OpenSimplex2Array: vectorized OpenSimplex 2D for arbitrary coordinates.
 - SimplexNoiseSource: wrapper around opensimplex.OpenSimplex.
+- ApplyPowerInPlace: fast power shaping for RidgePower/HeightPower.
 - GenerateFbmRidge: ridge-style FBM for BASE/DETAIL noise layers.
 - GenerateWarpOffsets: domain-warp offsets for WARP layers.
 - CombineWarpLayers: merges multiple warp layers into a single field.
@@ -18,11 +20,17 @@ Conventions
 
 from __future__ import annotations
 
-from typing import Tuple, Sequence, List
+import importlib.util
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
 
 import numpy as np
 from opensimplex import OpenSimplex
 
+# opensimplex compiles its array functions with numba when available;
+# without it, noise2array is a plain Python loop.
+_HasNumba = importlib.util.find_spec("numba") is not None
+
 # Assuming a package structure like:
 # from model.noise_layer import NoiseLayerConfig, NoiseLayerType
 # If you put this file flat next to the models, adjust the import accordingly.
@@ -33,6 +41,170 @@ except ImportError:  # pragma: no cover - fallback when used in a flat layout
     from noise_layer import NoiseLayerConfig, NoiseLayerType  # type: ignore
 
 
+# ---------------------------------------------------------------------------
+# Vectorized OpenSimplex 2D
+# ---------------------------------------------------------------------------
+
+# Constants of the OpenSimplex 2D algorithm (identical to the ones used by
+# the opensimplex package, so results match OpenSimplex.noise2).
+_STRETCH_CONSTANT2 = -0.211324865405187  # (1 / sqrt(2 + 1) - 1) / 2
+_SQUISH_CONSTANT2 = 0.366025403784439  # (sqrt(2 + 1) - 1) / 2
+_NORM_CONSTANT2 = 47.0
+
+# Gradients approximating the directions to the vertices of an octagon,
+# stored as interleaved (gx, gy) pairs.
+_GRADIENTS2 = np.array(
+    [5, 2, 2, 5, -5, 2, -2, 5, 5, -2, 2, -5, -5, -2, -2, -5],
+    dtype=np.float64,
+)
+
+
+def _GradientIndexTable(perm: np.ndarray) -> np.ndarray:
+    """512-entry table: perm masked to a gradient index, stored twice.
+
+    With it, perm[(perm[x & 0xFF] + y) & 0xFF] & 0x0E becomes
+    table[perm[x & 0xFF] + (y & 0xFF)]: the sum is < 512, so the wrap
+    and the final mask are baked into the table.
+    """
+
+    gradientIndex = np.asarray(perm, dtype=np.intp) & 0x0E
+    return np.concatenate((gradientIndex, gradientIndex))
+
+
+def _Extrapolate2(
+    perm: np.ndarray,
+    gradientIndex: np.ndarray,
+    xsb: np.ndarray,
+    ysb: np.ndarray,
+    dx: np.ndarray,
+    dy: np.ndarray,
+) -> np.ndarray:
+    """Gradient dot product for the lattice points (xsb, ysb)."""
+
+    index = gradientIndex[perm[xsb & 0xFF] + (ysb & 0xFF)]
+    return _GRADIENTS2[index] * dx + _GRADIENTS2[index + 1] * dy
+
+
+def _Contribution2(
+    perm: np.ndarray,
+    gradientIndex: np.ndarray,
+    xsb: np.ndarray,
+    ysb: np.ndarray,
+    dx: np.ndarray,
+    dy: np.ndarray,
+) -> np.ndarray:
+    """Attenuated contribution of one lattice vertex (0 outside its radius)."""
+
+    attn = 2.0 - dx * dx - dy * dy
+    attn = np.maximum(attn, 0.0)
+    attn *= attn
+    attn *= attn
+    attn *= _Extrapolate2(perm, gradientIndex, xsb, ysb, dx, dy)
+    return attn
+
+
+def OpenSimplex2Array(x: np.ndarray, y: np.ndarray, perm: np.ndarray) -> np.ndarray:
+    """Evaluate OpenSimplex 2D noise at arbitrary coordinate arrays.
+
+    A NumPy port of OpenSimplex.noise2: the per-sample branches are
+    turned into masks, so whole arrays are processed per operation. This
+    is what makes domain-warped (non-separable) coordinates affordable.
+
+    Parameters
+    ----------
+    x, y : np.ndarray
+        Coordinate arrays of the same shape.
+    perm : np.ndarray
+        The 256-entry permutation table of an OpenSimplex instance.
+
+    Returns
+    -------
+    np.ndarray
+        Float64 array of the same shape, matching noise2 per sample.
+    """
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    sq = _SQUISH_CONSTANT2
+
+    perm = np.asarray(perm, dtype=np.intp)
+    gradientIndex = _GradientIndexTable(perm)
+
+    # Place input coordinates onto grid
+    stretchOffset = (x + y) * _STRETCH_CONSTANT2
+    xs = x + stretchOffset
+    ys = y + stretchOffset
+
+    # Floor to get grid coordinates of the rhombus super-cell origin
+    xsbFloor = np.floor(xs)
+    ysbFloor = np.floor(ys)
+
+    # Skew out to get the actual coordinates of the rhombus origin
+    squishOffset = (xsbFloor + ysbFloor) * sq
+    dx0 = x - (xsbFloor + squishOffset)
+    dy0 = y - (ysbFloor + squishOffset)
+
+    # Grid coordinates relative to the rhombus origin; their sum tells
+    # which triangle (2-simplex) a sample is in
+    xins = xs - xsbFloor
+    yins = ys - ysbFloor
+    inSum = xins + yins
+
+    xsb = xsbFloor.astype(np.int64)
+    ysb = ysbFloor.astype(np.int64)
+
+    # Contributions (1, 0) and (0, 1)
+    value = _Contribution2(perm, gradientIndex, xsb + 1, ysb, dx0 - 1 - sq, dy0 - 0 - sq)
+    value += _Contribution2(perm, gradientIndex, xsb, ysb + 1, dx0 - 0 - sq, dy0 - 1 - sq)
+
+    # Extra vertex, chosen per region:
+    # lower triangle (inSum <= 1) around (0, 0), upper one around (1, 1)
+    lower = inSum <= 1
+    xGreater = xins > yins
+    zinsLower = 1 - inSum
+    zinsUpper = 2 - inSum
+    nearLower = lower & ((zinsLower > xins) | (zinsLower > yins))
+    nearUpper = ~lower & ((zinsUpper < xins) | (zinsUpper < yins))
+
+    conditions = [
+        nearLower & xGreater,
+        nearLower & ~xGreater,
+        lower,  # (1, 0) and (0, 1) are the closest two vertices
+        nearUpper & xGreater,
+        nearUpper & ~xGreater,
+    ]
+    xsvExt = np.select(conditions, [xsb + 1, xsb - 1, xsb + 1, xsb + 2, xsb], xsb)
+    ysvExt = np.select(conditions, [ysb - 1, ysb + 1, ysb + 1, ysb, ysb + 2], ysb)
+    dxExt = np.select(
+        conditions,
+        [dx0 - 1, dx0 + 1, dx0 - 1 - 2 * sq, dx0 - 2 - 2 * sq, dx0 + 0 - 2 * sq],
+        dx0,
+    )
+    dyExt = np.select(
+        conditions,
+        [dy0 + 1, dy0 - 1, dy0 - 1 - 2 * sq, dy0 + 0 - 2 * sq, dy0 - 2 - 2 * sq],
+        dy0,
+    )
+
+    # Contribution (0, 0) or (1, 1)
+    upper = ~lower
+    xsb[upper] += 1
+    ysb[upper] += 1
+    dx0 = np.where(upper, dx0 - 1 - 2 * sq, dx0)
+    dy0 = np.where(upper, dy0 - 1 - 2 * sq, dy0)
+    value += _Contribution2(perm, gradientIndex, xsb, ysb, dx0, dy0)
+
+    value += _Contribution2(perm, gradientIndex, xsvExt, ysvExt, dxExt, dyExt)
+
+    value /= _NORM_CONSTANT2
+    return value
+
+
+# ---------------------------------------------------------------------------
+# Noise source
+# ---------------------------------------------------------------------------
+
+
 class SimplexNoiseSource:
     """Wrapper around OpenSimplex to provide seeded 2D simplex noise.
 
@@ -42,7 +214,11 @@ class SimplexNoiseSource:
 
     def __init__(self, seed: int) -> None:
         self.Seed = int(seed)
-        self._Noise = OpenSimplex(seed=self.Seed)
+        self._Noise = _GetOpenSimplex(self.Seed)
+
+        # Permutation table for OpenSimplex2Array (None if this
+        # opensimplex version does not expose it)
+        self._Perm: Optional[np.ndarray] = getattr(self._Noise, "_perm", None)
 
         # Vectorized callable for noise2 (x, y) -> value
         self._Noise2DVectorized = np.vectorize(self._Noise.noise2)
@@ -50,11 +226,18 @@ class SimplexNoiseSource:
     def Sample2D(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
         """Sample 2D simplex noise for the given coordinate arrays.
 
+        With numba installed, separable grids (every row of x and every
+        column of y identical, as produced by BuildCoordinateGrid) are
+        evaluated from their 1D axes with the compiled
+        OpenSimplex.noise2array. Everything else, including
+        domain-warped coordinates, goes through the vectorized
+        OpenSimplex2Array. Both match OpenSimplex.noise2 exactly.
+
         Parameters
         ----------
         x, y : np.ndarray
-            Arrays (same shape) with coordinates where noise should be
-            sampled.
+            Arrays (same shape, or broadcastable such as (1, W) and
+            (H, 1) axes) with coordinates where noise should be sampled.
 
         Returns
         -------
@@ -62,10 +245,96 @@ class SimplexNoiseSource:
             Float32 array in approximately [-1, 1].
         """
 
-        values = self._Noise2DVectorized(x, y)
+        axes = _SeparableAxes(x, y) if _HasNumba else None
+        if axes is not None:
+            values = self._Noise.noise2array(axes[0], axes[1])
+        elif self._Perm is not None:
+            values = OpenSimplex2Array(x, y, self._Perm)
+        else:
+            values = self._Noise2DVectorized(x, y)
         return np.asarray(values, dtype=np.float32)
 
 
+def _GridShape(x: np.ndarray, y: np.ndarray) -> Tuple[int, ...]:
+    """Shape of the grid that coordinate arrays x and y broadcast to."""
+
+    return np.broadcast_shapes(x.shape, y.shape)
+
+
+@lru_cache(maxsize=32)
+def _GetOpenSimplex(seed: int) -> OpenSimplex:
+    """Return a shared OpenSimplex instance for `seed`.
+
+    Building the permutation tables runs a Python loop, and the same few
+    seeds are used on every render. Instances are read-only once seeded,
+    so sharing them (also across threads) is safe.
+    """
+
+    return OpenSimplex(seed=seed)
+
+
+def _SeparableAxes(x: np.ndarray, y: np.ndarray) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Return the 1D axes (xs, ys) if x/y form a separable 2D grid.
+
+    That is the case for a (1, W) row x and an (H, 1) column y, or for
+    full grids where x only varies along columns and y only along rows;
+    otherwise None is returned.
+    """
+
+    if x.ndim != 2 or y.ndim != 2 or x.size == 0 or y.size == 0:
+        return None
+
+    xs = x[0, :]
+    ys = y[:, 0]
+
+    if x.shape[0] == 1 and y.shape[1] == 1:
+        pass  # axes passed as such
+    elif x.shape != y.shape or not (
+        np.array_equal(x, np.broadcast_to(xs, x.shape))
+        and np.array_equal(y, np.broadcast_to(ys[:, None], y.shape))
+    ):
+        return None
+
+    # noise2array computes in the dtype of its inputs; use double
+    # precision like the scalar noise2 does.
+    return xs.astype(np.float64), ys.astype(np.float64)
+
+
+def ApplyPowerInPlace(values: np.ndarray, power: float) -> np.ndarray:
+    """Raise non-negative `values` to `power` in place and return them.
+
+    Common exponents are dispatched to multiplications / sqrt, which are
+    much cheaper than the generic pow() used by np.power.
+    """
+
+    power = float(power)
+
+    if power == 1.0:
+        pass
+    elif power == 2.0:
+        np.multiply(values, values, out=values)
+    elif power == 3.0:
+        squared = values * values
+        np.multiply(values, squared, out=values)
+    elif power == 4.0:
+        np.multiply(values, values, out=values)
+        np.multiply(values, values, out=values)
+    elif power == 0.5:
+        np.sqrt(values, out=values)
+    elif power == 1.5:
+        root = np.sqrt(values)
+        np.multiply(values, root, out=values)
+    else:
+        np.power(values, power, out=values)
+
+    return values
+
+
+# Pixels per row band in GenerateFbmRidge: small enough that the band and
+# the per-octave noise temporaries fit in L2.
+_FbmBandPixels = 1 << 14
+
+
 def GenerateFbmRidge(
     layerConfig: "NoiseLayerConfig",
     baseX: np.ndarray,
@@ -88,7 +357,8 @@ def GenerateFbmRidge(
     layerConfig : NoiseLayerConfig
         Configuration describing scale, octaves, persistence, etc.
     baseX, baseY : np.ndarray
-        Normalized coordinate grids in [0, 1]. Must have the same shape.
+        Normalized coordinate grids in [0, 1]. Must broadcast to the same
+        grid, e.g. a (1, W) row and an (H, 1) column.
 
     Returns
     -------
@@ -102,15 +372,46 @@ def GenerateFbmRidge(
         raise ValueError("GenerateFbmRidge is intended for BASE or DETAIL layers only.")
 
     if not layerConfig.Enabled:
-        return np.zeros_like(baseX, dtype=np.float32)
+        return np.zeros(_GridShape(baseX, baseY), dtype=np.float32)
 
     noiseSource = SimplexNoiseSource(layerConfig.Seed)
 
+    gridShape = _GridShape(baseX, baseY)
+    total = np.empty(gridShape, dtype=np.float32)
+
+    # Run all octaves on one band of rows at a time, so the band and the
+    # noise temporaries stay in cache instead of streaming the whole grid
+    # through memory once per octave. Every pixel is computed exactly as
+    # before, so the result does not depend on the band height.
+    bandRows = max(1, _FbmBandPixels // max(1, gridShape[1]))
+    for row0 in range(0, gridShape[0], bandRows):
+        rows = slice(row0, row0 + bandRows)
+        _FbmRidgeBand(
+            layerConfig,
+            noiseSource,
+            baseX[rows] if baseX.shape[0] > 1 else baseX,
+            baseY[rows] if baseY.shape[0] > 1 else baseY,
+            total[rows],
+        )
+
+    return total
+
+
+def _FbmRidgeBand(
+    layerConfig: "NoiseLayerConfig",
+    noiseSource: SimplexNoiseSource,
+    baseX: np.ndarray,
+    baseY: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    """Ridge FBM octave loop for one band of rows (see GenerateFbmRidge)."""
+
     frequencyX = float(layerConfig.ScaleX)
     frequencyY = float(layerConfig.ScaleY)
     amplitude = 1.0
 
-    total = np.zeros_like(baseX, dtype=np.float32)
+    total = out
+    total.fill(0.0)
     amplitudeSum = 0.0
 
     octaves = max(1, int(layerConfig.Octaves))
@@ -118,21 +419,26 @@ def GenerateFbmRidge(
     lacunarity = float(layerConfig.Lacunarity)
     ridgePower = float(layerConfig.RidgePower)
 
+    # Scratch buffers for the scaled coordinates, reused by every octave
+    x = np.empty(baseX.shape, dtype=baseX.dtype)
+    y = np.empty(baseY.shape, dtype=baseY.dtype)
+
     for _ in range(octaves):
         # Scale coordinates for this octave
-        x = baseX * frequencyX
-        y = baseY * frequencyY
+        np.multiply(baseX, frequencyX, out=x)
+        np.multiply(baseY, frequencyY, out=y)
 
-        n = noiseSource.Sample2D(x, y)  # [-1, 1]
+        n = noiseSource.Sample2D(x, y)  # [-1, 1], float32, ours to modify
 
-        # Ridge transform: values in [0, 1]
-        n = 1.0 - np.abs(n)
-        n = np.clip(n, 0.0, 1.0)
+        # Ridge transform in place: values in [0, 1] (no clip needed,
+        # |n| <= 1 for OpenSimplex 2D)
+        np.abs(n, out=n)
+        np.subtract(1.0, n, out=n)
 
-        if ridgePower != 1.0:
-            n = np.power(n, ridgePower, dtype=np.float32)
+        ApplyPowerInPlace(n, ridgePower)
 
-        total += n.astype(np.float32) * amplitude
+        n *= amplitude
+        total += n
         amplitudeSum += amplitude
 
         amplitude *= persistence
@@ -144,13 +450,19 @@ def GenerateFbmRidge(
 
     # Ensure the output is within [0, 1]
     np.clip(total, 0.0, 1.0, out=total)
-    return total
+
+
+def _IsZeroAmplitude(layerConfig: "NoiseLayerConfig") -> bool:
+    """True if the layer's Amplitude is (numerically) zero."""
+
+    return abs(float(layerConfig.Amplitude)) < 1e-9
 
 
 def GenerateWarpOffsets(
     layerConfig: "NoiseLayerConfig",
     baseX: np.ndarray,
     baseY: np.ndarray,
+    out: Optional[Tuple[np.ndarray, np.ndarray]] = None,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """Generate domain-warping offsets (wx, wy) for a WARP layer.
 
@@ -168,13 +480,16 @@ def GenerateWarpOffsets(
     layerConfig : NoiseLayerConfig
         Must have LayerType == Warp.
     baseX, baseY : np.ndarray
-        Normalized coordinate grids in [0, 1].
+        Normalized coordinate grids in [0, 1] (or (1, W) / (H, 1) axes).
+    out : (np.ndarray, np.ndarray), optional
+        Float32 buffers of the grid shape that receive wx and wy
+        (overwritten), so callers can reuse them across layers.
 
     Returns
     -------
     (wx, wy) : Tuple[np.ndarray, np.ndarray]
         Float32 arrays with the same shape as baseX/baseY containing the
-        coordinate offsets to add to (x, y).
+        coordinate offsets to add to (x, y). These are `out` if given.
     """
 
     from model.noise_layer import NoiseLayerType as _NLT  # local alias
@@ -182,9 +497,20 @@ def GenerateWarpOffsets(
     if layerConfig.LayerType is not _NLT.Warp:
         raise ValueError("GenerateWarpOffsets is intended for WARP layers only.")
 
-    if not layerConfig.Enabled:
-        zeros = np.zeros_like(baseX, dtype=np.float32)
-        return zeros, zeros
+    # Disabled or zero-amplitude layers contribute nothing; skip the FBM
+    gridShape = _GridShape(baseX, baseY)
+    if out is None:
+        wx = np.zeros(gridShape, dtype=np.float32)
+        wy = np.zeros(gridShape, dtype=np.float32)
+    else:
+        wx, wy = out
+        if wx.shape != gridShape or wy.shape != gridShape:
+            raise ValueError("out buffers must have the grid shape")
+        wx.fill(0.0)
+        wy.fill(0.0)
+
+    if not layerConfig.Enabled or _IsZeroAmplitude(layerConfig):
+        return wx, wy
 
     noiseSource = SimplexNoiseSource(layerConfig.Seed)
 
@@ -192,24 +518,32 @@ def GenerateWarpOffsets(
     frequencyY = float(layerConfig.ScaleY)
     amplitude = 1.0
 
-    wx = np.zeros_like(baseX, dtype=np.float32)
-    wy = np.zeros_like(baseY, dtype=np.float32)
     amplitudeSum = 0.0
 
     octaves = max(1, int(layerConfig.Octaves))
     persistence = float(layerConfig.Persistence)
     lacunarity = float(layerConfig.Lacunarity)
 
+    # Scratch buffers for the scaled coordinates, reused by every octave
+    x = np.empty(baseX.shape, dtype=baseX.dtype)
+    y = np.empty(baseY.shape, dtype=baseY.dtype)
+
     for _ in range(octaves):
-        x = baseX * frequencyX
-        y = baseY * frequencyY
+        np.multiply(baseX, frequencyX, out=x)
+        np.multiply(baseY, frequencyY, out=y)
 
-        # Two different noise samples for x and y offsets (shifted coords)
+        # Two different noise samples for x and y offsets (shifted coords,
+        # shifted in place once the first sample is taken)
         wx_oct = noiseSource.Sample2D(x, y)
-        wy_oct = noiseSource.Sample2D(x + 1000.0, y + 1000.0)
-
-        wx += wx_oct.astype(np.float32) * amplitude
-        wy += wy_oct.astype(np.float32) * amplitude
+        x += 1000.0
+        y += 1000.0
+        wy_oct = noiseSource.Sample2D(x, y)
+
+        # The samples are fresh float32 arrays; weight them in place
+        wx_oct *= amplitude
+        wy_oct *= amplitude
+        wx += wx_oct
+        wy += wy_oct
         amplitudeSum += amplitude
 
         amplitude *= persistence
@@ -242,7 +576,7 @@ def CombineWarpLayers(
     warpLayers : sequence of NoiseLayerConfig
         Only layers with LayerType == Warp and Enabled == True are used.
     baseX, baseY : np.ndarray
-        Normalized coordinate grids in [0, 1].
+        Normalized coordinate grids in [0, 1] (or (1, W) / (H, 1) axes).
 
     Returns
     -------
@@ -252,15 +586,27 @@ def CombineWarpLayers(
 
     from model.noise_layer import NoiseLayerType as _NLT  # local alias
 
-    wxTotal = np.zeros_like(baseX, dtype=np.float32)
-    wyTotal = np.zeros_like(baseY, dtype=np.float32)
-
-    for layer in warpLayers:
-        if not layer.Enabled or layer.LayerType is not _NLT.Warp:
-            continue
-
-        wx, wy = GenerateWarpOffsets(layer, baseX, baseY)
-        wxTotal += wx
-        wyTotal += wy
+    activeLayers = [
+        layer
+        for layer in warpLayers
+        if layer.Enabled and layer.LayerType is _NLT.Warp and not _IsZeroAmplitude(layer)
+    ]
+
+    gridShape = _GridShape(baseX, baseY)
+    if not activeLayers:
+        return np.zeros(gridShape, dtype=np.float32), np.zeros(gridShape, dtype=np.float32)
+
+    # The first layer writes straight into the totals; the others share
+    # one pair of scratch buffers that is added on top.
+    wxTotal = np.empty(gridShape, dtype=np.float32)
+    wyTotal = np.empty(gridShape, dtype=np.float32)
+    GenerateWarpOffsets(activeLayers[0], baseX, baseY, out=(wxTotal, wyTotal))
+
+    if len(activeLayers) > 1:
+        scratch = (np.empty(gridShape, dtype=np.float32), np.empty(gridShape, dtype=np.float32))
+        for layer in activeLayers[1:]:
+            wx, wy = GenerateWarpOffsets(layer, baseX, baseY, out=scratch)
+            wxTotal += wx
+            wyTotal += wy
 
     return wxTotal, wyTotal
\ No newline at end of file
@@ -19,7 +19,7 @@ Conventions
 
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
 from PIL import Image
@@ -32,13 +32,12 @@ try:
     from core.gradient import (
         ComputeGradientTFromAngle,
         EvaluateGradientAt,
-        RgbFloatToUint8,
     )
 except ImportError:  # pragma: no cover - fallback for flat layout / prototyping
     from project_config import ProjectConfig  # type: ignore
     from heightmap import BuildHeightmapWithLayerMaps  # type: ignore
     from lighting import ComputeShadeFromHeightmap  # type: ignore
-    from gradient import ComputeGradientTFromAngle, EvaluateGradientAt, RgbFloatToUint8  # type: ignore
+    from gradient import ComputeGradientTFromAngle, EvaluateGradientAt  # type: ignore
 
 
 # ---------------------------------------------------------------------------
@@ -77,6 +76,71 @@ def ComposeColor(
     if baseR.shape != shade.shape or baseR.shape != height.shape:
         raise ValueError("baseR, shade, and height must have the same shape")
 
+    brightness = _ComputeBrightness(shade, height, heightInfluence)
+
+    r = np.multiply(baseR, brightness, dtype=np.float32)
+    g = np.multiply(baseG, brightness, dtype=np.float32)
+    b = np.multiply(baseB, brightness, dtype=np.float32)
+
+    return r, g, b
+
+
+def ComposeColorToUint8(
+    baseR: np.ndarray,
+    baseG: np.ndarray,
+    baseB: np.ndarray,
+    shade: np.ndarray,
+    height: np.ndarray,
+    heightInfluence: float = 0.2,
+    out: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """ComposeColor followed by RgbFloatToUint8, fused.
+
+    The brightness map is computed once, pre-scaled to [0, 255], and each
+    channel is multiplied, clamped and cast through a single reused
+    float32 scratch buffer, instead of materializing float RGB planes and
+    then their uint8 conversions. Folding the 255 into the brightness
+    saves one full pass per channel; the result can differ from the
+    two-step path by at most one step where rounding crosses an integer.
+
+    If given, `out` is a uint8 (H, W, 3) array (or view, e.g. the RGB
+    part of an RGBA image) that receives the channels.
+
+    Returns
+    -------
+    (r8, g8, b8) : Tuple[np.ndarray, np.ndarray, np.ndarray]
+        uint8 channel views into one (H, W, 3) buffer (`out` if given).
+    """
+
+    if baseR.shape != shade.shape or baseR.shape != height.shape:
+        raise ValueError("baseR, shade, and height must have the same shape")
+
+    brightness = _ComputeBrightness(shade, height, heightInfluence)
+    brightness *= 255.0
+
+    if out is None:
+        out = np.empty(baseR.shape + (3,), dtype=np.uint8)
+    elif out.dtype != np.uint8 or out.shape != baseR.shape + (3,):
+        raise ValueError("out must be a uint8 array of shape (H, W, 3)")
+
+    rgb8 = out
+    scratch = np.empty(baseR.shape, dtype=np.float32)
+
+    for channel, base in enumerate((baseR, baseG, baseB)):
+        np.multiply(base, brightness, out=scratch)
+        np.clip(scratch, 0.0, 255.0, out=scratch)
+        rgb8[..., channel] = scratch  # truncating cast, as in astype
+
+    return rgb8[..., 0], rgb8[..., 1], rgb8[..., 2]
+
+
+def _ComputeBrightness(
+    shade: np.ndarray,
+    height: np.ndarray,
+    heightInfluence: float,
+) -> np.ndarray:
+    """Per-pixel brightness: shade modulated by height (see ComposeColor)."""
+
     # Optional: height-based modulation: Kämme etwas heller, Täler dunkler
     influence = float(heightInfluence)
     if influence < 0.0:
@@ -84,18 +148,17 @@ def ComposeColor(
     if influence > 1.0:
         influence = 1.0
 
-    # Map height to a factor around 1.0, e.g. 0.8–1.2
-    heightFactor = 1.0 - 0.2 * (1.0 - height)  # slightly darken low areas
-    # Blend between no height influence (1.0) and full heightFactor
-    combinedFactor = (1.0 - influence) * 1.0 + influence * heightFactor
-
-    brightness = shade * combinedFactor
-
-    r = baseR * brightness
-    g = baseG * brightness
-    b = baseB * brightness
+    # Map height to a factor around 1.0, e.g. 0.8–1.2: slightly darken
+    # low areas (heightFactor = 1 - 0.2 * (1 - height)). Then blend between
+    # no height influence (1.0) and full heightFactor. All in one buffer.
+    factor = np.subtract(1.0, height, dtype=np.float32)
+    factor *= 0.2
+    np.subtract(1.0, factor, out=factor)
+    factor *= influence
+    factor += (1.0 - influence) * 1.0
 
-    return r.astype(np.float32), g.astype(np.float32), b.astype(np.float32)
+    factor *= shade
+    return factor
 
 
 # ---------------------------------------------------------------------------
@@ -113,22 +176,62 @@ def RenderImageToArrays(
     This is the low-level entry point; the GUI or export code can use
     this directly or via RenderImageToPillow.
 
+    Returns
+    -------
+    (r8, g8, b8, a8): Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+        Each channel is a 2D uint8 array with shape (height, width).
+    """
+
+    rgba = RenderImageToRgba(projectConfig, width, height)
+    return rgba[..., 0], rgba[..., 1], rgba[..., 2], rgba[..., 3]
+
+
+def RenderImageToRgba(
+    projectConfig: "ProjectConfig",
+    width: int,
+    height: int,
+) -> np.ndarray:
+    """Render the scene to a single interleaved RGBA uint8 image.
+
+    Returns
+    -------
+    np.ndarray
+        C-contiguous uint8 array of shape (height, width, 4), ready to be
+        wrapped by Pillow or Qt without stacking the channels.
+    """
+
+    rgba, _ = RenderImageWithLayerMaps(projectConfig, width, height)
+    return rgba
+
+
+def RenderImageWithLayerMaps(
+    projectConfig: "ProjectConfig",
+    width: int,
+    height: int,
+) -> Tuple[np.ndarray, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Render the scene and also return the normalized layer maps.
+
+    The Base/Detail/Combined maps are produced by the heightmap build
+    anyway, so callers that show noise previews next to the image can
+    reuse them instead of building the heightmap a second time.
+
     Steps:
     - Build heightmap (with layer maps if needed).
     - Compute shade from heightmap and lighting config.
     - Compute gradient t-field from angle, then evaluate gradient colors.
     - Combine base colors and shade (+ height influence).
-    - Convert to uint8.
+    - Convert to uint8, written straight into one RGBA buffer.
 
     Returns
     -------
-    (r8, g8, b8, a8): Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
-        Each channel is a 2D uint8 array with shape (height, width).
+    (rgba, (baseMap, detailMap, combinedMap))
+        The (height, width, 4) uint8 image (see RenderImageToRgba) and
+        float32 maps in [0, 1] of shape (height, width).
     """
 
-    # Heightmap and layer maps (we only need finalHeight here, but the
-    # others may be useful for diagnostic previews in the UI)
-    finalHeight, _, _, _ = BuildHeightmapWithLayerMaps(
+    # Heightmap and layer maps (we only need finalHeight here, the others
+    # are handed back for diagnostic previews in the UI)
+    finalHeight, baseMap, detailMap, combinedMap = BuildHeightmapWithLayerMaps(
         projectConfig,
         width,
         height,
@@ -143,28 +246,39 @@ def RenderImageToArrays(
         maxBrightness=1.0,
     )
 
-    # Gradient parameter and base color
-    t = ComputeGradientTFromAngle(width, height, projectConfig.Gradient.AngleDeg)
+    # Gradient parameter and base color. t only indexes the gradient LUT,
+    # so half precision is enough and halves the traffic of the gather.
+    t = ComputeGradientTFromAngle(
+        width,
+        height,
+        projectConfig.Gradient.AngleDeg,
+        dtype=np.float16,
+    )
     baseR, baseG, baseB, alpha = EvaluateGradientAt(projectConfig.Gradient, t)
 
-    # Combine base color with shade and height-based modulation
-    r, g, b = ComposeColor(
+    rgba = np.empty((height, width, 4), dtype=np.uint8)
+
+    # Combine base color with shade and height-based modulation, straight
+    # to uint8
+    ComposeColorToUint8(
         baseR,
         baseG,
         baseB,
         shade,
         finalHeight,
         heightInfluence=0.25,
+        out=rgba[..., 0:3],
     )
 
-    r8, g8, b8 = RgbFloatToUint8(r, g, b)
-
     # Alpha: we currently use the gradient alpha (stops' opacity) mapped
     # to [0, 255]. If you prefer fully opaque output, replace this with
     # a constant 255.
-    a8 = (np.clip(alpha, 0.0, 1.0) * 255.0).astype(np.uint8)
+    # The float gather is ours, so scale the alpha view in place.
+    np.clip(alpha, 0.0, 1.0, out=alpha)
+    alpha *= 255.0
+    rgba[..., 3] = alpha  # truncating cast
 
-    return r8, g8, b8, a8
+    return rgba, (baseMap, detailMap, combinedMap)
 
 
 def RenderImageToPillow(
@@ -174,9 +288,6 @@ def RenderImageToPillow(
 ) -> Image.Image:
     """Render the scene and return a Pillow RGBA Image."""
 
-    r8, g8, b8, a8 = RenderImageToArrays(projectConfig, width, height)
-
-    # Stack into an RGBA image buffer
-    rgba = np.dstack([r8, g8, b8, a8])
+    rgba = RenderImageToRgba(projectConfig, width, height)
     img = Image.fromarray(rgba, mode="RGBA")
     return img
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""io/json_utils.py
+
+JSON file helpers shared by the palette and project IO modules.
+
+WriteJson/ReadJson use orjson when it is installed (bytes in, bytes out,
+no separate encode/decode step) and fall back to the standard json
+module otherwise. Both write the same 2-space indented UTF-8 JSON.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    # Optional fast path: orjson encodes/decodes UTF-8 bytes directly
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - orjson is an optional dependency
+    _orjson = None
+    import json as _json
+
+
+def WriteJson(data: Any, path: Union[str, Path]) -> None:
+    """Write data as indented (2 spaces) UTF-8 JSON."""
+
+    file_path = Path(path)
+    if _orjson is not None:
+        file_path.write_bytes(_orjson.dumps(data, option=_orjson.OPT_INDENT_2))
+    else:
+        file_path.write_text(_json.dumps(data, indent=2), encoding="utf-8")
+
+
+def ReadJson(path: Union[str, Path]) -> Any:
+    """Read a UTF-8 JSON file (orjson parses the raw bytes, no decode step)."""
+
+    file_path = Path(path)
+    if _orjson is not None:
+        return _orjson.loads(file_path.read_bytes())
+    return _json.loads(file_path.read_text(encoding="utf-8"))
@@ -1,44 +1,77 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Union
-import json
+
+try:
+    from .json_utils import ReadJson, WriteJson
+except ImportError:  # pragma: no cover - fallback for flat layout
+    from json_utils import ReadJson, WriteJson  # type: ignore
 
 # WICHTIG: Palette aus dem model-Paket importieren
 from model.palette import Palette
 
 
 def SavePalette(palette: Palette, path: Union[str, Path]) -> None:
-    file_path = Path(path)
-    data = palette.ToDict()
-    file_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    WriteJson(palette.ToDict(), path)
 
 
 def LoadPalette(path: Union[str, Path]) -> Palette:
-    file_path = Path(path)
-    raw = file_path.read_text(encoding="utf-8")
-    data = json.loads(raw)
+    data = ReadJson(path)
     return Palette.FromDict(data)
 
 
 def SavePalettes(palettes: List[Palette], path: Union[str, Path]) -> None:
-    file_path = Path(path)
-    data = [p.ToDict() for p in palettes]
-    file_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    WriteJson([p.ToDict() for p in palettes], path)
 
 
 def LoadPalettes(path: Union[str, Path]) -> List[Palette]:
-    file_path = Path(path)
-    raw = file_path.read_text(encoding="utf-8")
-    data_list = json.loads(raw)
-
-    result: List[Palette] = []
-    if isinstance(data_list, list):
-        for item in data_list:
-            if isinstance(item, dict):
-                result.append(Palette.FromDict(item))
-    elif isinstance(data_list, dict):
+    data_list = ReadJson(path)
+
+    if isinstance(data_list, dict):
         # Fallback: single palette stored as dict
-        result.append(Palette.FromDict(data_list))
+        return [Palette.FromDict(data_list)]
+    if not isinstance(data_list, list):
+        return []
+
+    fromDict = Palette.FromDict
+    return [fromDict(item) for item in data_list if isinstance(item, dict)]
+
+
+def _LoadPaletteFileStrict(path: Union[str, Path]) -> List[Palette]:
+    """Like LoadPalettes, but skip entries that have no "colors" list.
+
+    Palette directories may also contain other JSON files (e.g. saved
+    projects), which must not turn into empty "unnamed" palettes.
+    """
+
+    data = ReadJson(path)
+    items = [data] if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        return []
+
+    return [
+        Palette.FromDict(item)
+        for item in items
+        if isinstance(item, dict) and isinstance(item.get("colors"), list)
+    ]
+
+
+def LoadPaletteDirectory(dir_path: Union[str, Path]) -> List[Palette]:
+    """Load every *.json palette file in a directory.
+
+    Files may hold a single palette or a list (see LoadPalettes); entries
+    without a "colors" list are skipped. Files are read and parsed
+    concurrently, since file IO (and orjson) release the GIL; the result
+    is in file name order.
+    """
+
+    paths = sorted(Path(dir_path).glob("*.json"))
+    if not paths:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        perFile = list(executor.map(_LoadPaletteFileStrict, paths))
 
-    return result
+    return [palette for palettes in perFile for palette in palettes]
@@ -3,11 +3,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 import json
+import sys
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GradientStop:
     Position: float  # 0.0 – 1.0
     Color: str       # "#rrggbb"
@@ -24,22 +26,33 @@ class GradientStop:
     def FromDict(data: Dict[str, Any]) -> "GradientStop":
         return GradientStop(
             Position=float(data.get("position", 0.0)),
-            Color=str(data.get("color", "#000000")),
+            Color=sys.intern(str(data.get("color", "#000000"))),
             Opacity=float(data.get("opacity", 1.0)),
         )
 
 
-@dataclass
+_StopPosition = attrgetter("Position")
+
+
+@dataclass(slots=True)
 class GradientConfig:
+    """Gradient stops plus the gradient angle.
+
+    Stops are kept sorted by Position: the constructor sorts them, and
+    code that assigns a new Stops list must pass it sorted.
+    """
+
     Stops: List[GradientStop] = field(default_factory=list)
     AngleDeg: float = 20.0  # 0–360°
 
+    def __post_init__(self) -> None:
+        self.Stops.sort(key=_StopPosition)
+
     def ToDict(self) -> Dict[str, Any]:
-        # Ensure stops are sorted by Position
-        sorted_stops = sorted(self.Stops, key=lambda s: s.Position)
+        # Stops are already sorted by Position (see class docstring)
         return {
             "angle_deg": float(self.AngleDeg),
-            "stops": [stop.ToDict() for stop in sorted_stops],
+            "stops": [stop.ToDict() for stop in self.Stops],
         }
 
     @staticmethod
@@ -51,9 +64,7 @@ class GradientConfig:
             GradientStop.FromDict(stop_dict) for stop_dict in stops_data
         ]
 
-        # Sort to guarantee ascending position order
-        stops.sort(key=lambda s: s.Position)
-
+        # The constructor sorts to guarantee ascending position order
         return GradientConfig(Stops=stops, AngleDeg=angle)
 
     @staticmethod
@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 import json
 
-@dataclass
+@dataclass(slots=True)
 class LightingConfig:
     LightAzimuthDeg: float = 45.0   # 0–360°
     LightElevationDeg: float = 60.0 # 0–90°
@@ -7,13 +7,27 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 import json
 
-class NoiseLayerType(str, Enum):
+try:
+    from enum import StrEnum
+except ImportError:  # pragma: no cover - Python < 3.11
+    class StrEnum(str, Enum):
+        """Minimal stand-in for enum.StrEnum on older Pythons."""
+
+        def __str__(self) -> str:
+            return str(self.value)
+
+
+class NoiseLayerType(StrEnum):
     Base = "base"
     Detail = "detail"
     Warp = "warp"
 
 
-@dataclass
+# Serialized value -> member, for FromDict (unknown values fall back to Base)
+_LAYER_TYPE_MAP: Dict[str, NoiseLayerType] = {member.value: member for member in NoiseLayerType}
+
+
+@dataclass(slots=True)
 class NoiseLayerConfig:
     LayerType: NoiseLayerType
     Enabled: bool = True
@@ -44,11 +58,7 @@ class NoiseLayerConfig:
 
     @staticmethod
     def FromDict(data: Dict[str, Any]) -> "NoiseLayerConfig":
-        layer_type_str = str(data.get("layer_type", "base"))
-        try:
-            layer_type = NoiseLayerType(layer_type_str)
-        except ValueError:
-            layer_type = NoiseLayerType.Base
+        layer_type = _LAYER_TYPE_MAP.get(str(data.get("layer_type", "base")), NoiseLayerType.Base)
 
         return NoiseLayerConfig(
             LayerType=layer_type,
@@ -6,8 +6,9 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 import json
+import sys
 
-@dataclass
+@dataclass(slots=True)
 class Palette:
     Name: str
     Colors: List[str]  # Hex colors like "#0a1628"
@@ -15,17 +16,19 @@ class Palette:
     def ToDict(self) -> Dict[str, Any]:
         """Serialize Palette to a JSON-compatible dict.
 
-        Keys follow the spec (name, colors).
+        Keys follow the spec (name, colors). The colors list is shared,
+        not copied; the dict is meant to be handed to the JSON encoder.
         """
 
         return {
             "name": self.Name,
-            "colors": list(self.Colors),
+            "colors": self.Colors,
         }
 
     @staticmethod
     def FromDict(data: Dict[str, Any]) -> "Palette":
         return Palette(
             Name=data.get("name", "unnamed"),
-            Colors=list(data.get("colors", [])),
+            # Interned: the same hex strings recur across palettes/stops
+            Colors=[sys.intern(str(color)) for color in data.get("colors", [])],
         )
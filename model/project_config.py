@@ -9,7 +9,7 @@ from model.noise_layer import NoiseLayerConfig, NoiseLayerType
 from model.lighting_config import LightingConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectConfig:
     Palette: Palette
     Gradient: GradientConfig
@@ -23,6 +23,18 @@ class ProjectConfig:
 
     SeedGlobal: int = 42
 
+    @property
+    def WarpLayers(self) -> List[NoiseLayerConfig]:
+        """All WARP layers, in stack order."""
+
+        return [layer for layer in self.NoiseLayers if layer.LayerType is NoiseLayerType.Warp]
+
+    @property
+    def NonWarpLayers(self) -> List[NoiseLayerConfig]:
+        """All BASE/DETAIL layers, in stack order."""
+
+        return [layer for layer in self.NoiseLayers if layer.LayerType is not NoiseLayerType.Warp]
+
     def ToDict(self) -> Dict[str, Any]:
         """Serialize the entire project configuration to a dict
         compatible with the JSON example in the spec.
@@ -3,17 +3,18 @@
 Export panel for the Frost Dune Background Generator.
 
 This widget provides a UI to configure export resolution and trigger a
-PNG export using the current ProjectConfig.
+PNG/JPEG export using the current ProjectConfig.
 
 Features
 --------
 - Preset resolutions (16:9, 4:3, portrait, etc.).
 - Landscape/Portrait toggle (swaps width/height for presets).
 - Custom width/height spin boxes.
+- PNG compression level (zlib 0-9; low levels save much faster).
 - Export button that emits a signal with the chosen width/height.
 
 The panel itself does **not** perform rendering or file I/O; it only
-emits ExportRequested(width, height). The MainWindow (or controller
+emits ExportRequested(width, height, compressLevel). The MainWindow (or controller
 layer) is responsible for calling the renderer and saving the image.
 
 Naming follows a C#-like convention (PascalCase for classes, methods,
@@ -43,7 +44,12 @@ from PySide6.QtWidgets import (
 class ExportPanel(QGroupBox):
     """UI panel for configuring export resolution and triggering export."""
 
-    ExportRequested = Signal(int, int)  # width, height
+    ExportRequested = Signal(int, int, int)  # width, height, compressLevel
+
+    # zlib level used for PNG export. The export is the final deliverable,
+    # so Pillow's default of 6 is kept; users can lower it in the spin box
+    # to trade file size for a faster save.
+    DefaultPngCompressLevel = 6
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__("Export", parent)
@@ -111,10 +117,20 @@ class ExportPanel(QGroupBox):
         form.addRow(QLabel("Width:", self), self._WidthSpin)
         form.addRow(QLabel("Height:", self), self._HeightSpin)
 
+        # PNG compression ------------------------------------------------
+        self._CompressLevelSpin = QSpinBox(self)
+        self._CompressLevelSpin.setRange(0, 9)
+        self._CompressLevelSpin.setValue(self.DefaultPngCompressLevel)
+        self._CompressLevelSpin.setToolTip(
+            "zlib compression level (0 = none / fastest, 9 = smallest file)"
+        )
+
+        form.addRow(QLabel("PNG compression:", self), self._CompressLevelSpin)
+
         layout.addLayout(form)
 
         # Export button --------------------------------------------------
-        self._ExportButton = QPushButton("Export PNG…", self)
+        self._ExportButton = QPushButton("Export Image…", self)
         self._ExportButton.clicked.connect(self._OnExportClicked)
 
         layout.addWidget(self._ExportButton)
@@ -176,8 +192,9 @@ class ExportPanel(QGroupBox):
     def _OnExportClicked(self) -> None:
         width = int(self._WidthSpin.value())
         height = int(self._HeightSpin.value())
+        compressLevel = int(self._CompressLevelSpin.value())
 
         if width <= 0 or height <= 0:
             return
 
-        self.ExportRequested.emit(width, height)
\ No newline at end of file
+        self.ExportRequested.emit(width, height, compressLevel)
\ No newline at end of file
@@ -17,10 +17,11 @@ properties) where possible, while still integrating with Qt.
 
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import Optional
 
 import numpy as np
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtGui import QColor, QImage, QPixmap
 from PySide6.QtWidgets import (
     QColorDialog,
@@ -41,10 +42,10 @@ from PySide6.QtWidgets import (
 try:
     # Project layout imports
     from model.gradient_model import GradientConfig, GradientStop
-    from core.gradient import ApplyGradient, RgbFloatToUint8
+    from core.gradient import ComputeGradientTFromAngle, EvaluateGradientAtU8
 except ImportError:  # pragma: no cover - fallback for flat layout
     from gradient_model import GradientConfig, GradientStop  # type: ignore
-    from gradient import ApplyGradient, RgbFloatToUint8  # type: ignore
+    from gradient import ComputeGradientTFromAngle, EvaluateGradientAtU8  # type: ignore
 
 
 # ---------------------------------------------------------------------------
@@ -52,6 +53,13 @@ except ImportError:  # pragma: no cover - fallback for flat layout
 # ---------------------------------------------------------------------------
 
 
+_StopPosition = attrgetter("Position")  # sort key for GradientStop lists
+
+# Slider drags and spin box edits fire once per step; the preview is
+# redrawn once the edits pause for this long.
+PreviewDebounceMs = 30
+
+
 def NumpyRgbaToQPixmap(rgba: np.ndarray) -> QPixmap:
     """Convert an RGBA uint8 NumPy array (H, W, 4) to a QPixmap."""
 
@@ -66,7 +74,7 @@ def NumpyRgbaToQPixmap(rgba: np.ndarray) -> QPixmap:
         height,
         rgba.strides[0],
         QImage.Format_RGBA8888,
-    ).copy()
+    )
 
     return QPixmap.fromImage(image)
 
@@ -86,6 +94,16 @@ class GradientPanel(QGroupBox):
 
         self._Gradient: Optional[GradientConfig] = None
 
+        # (angle, stops) the preview bar currently shows; redraws with the
+        # same values are skipped
+        self._PreviewKey: Optional[tuple] = None
+
+        # Coalesces bursts of edits into one preview redraw
+        self._PreviewTimer = QTimer(self)
+        self._PreviewTimer.setSingleShot(True)
+        self._PreviewTimer.setInterval(PreviewDebounceMs)
+        self._PreviewTimer.timeout.connect(self._UpdatePreview)
+
         self._CreateUi()
 
     # ------------------------------------------------------------------
@@ -204,7 +222,7 @@ class GradientPanel(QGroupBox):
             return
 
         self._Gradient.AngleDeg = float(angle)
-        self._UpdatePreview()
+        self._SchedulePreview()
         self.GradientChanged.emit(self._Gradient)
 
     # ------------------------------------------------------------------
@@ -216,7 +234,7 @@ class GradientPanel(QGroupBox):
             self._StopsTable.setRowCount(0)
             return
 
-        stops = sorted(self._Gradient.Stops, key=lambda s: s.Position)
+        stops = sorted(self._Gradient.Stops, key=_StopPosition)
         self._StopsTable.setRowCount(0)
 
         for stop in stops:
@@ -291,7 +309,7 @@ class GradientPanel(QGroupBox):
         defaultOpacity = 1.0
 
         if self._Gradient.Stops:
-            last = sorted(self._Gradient.Stops, key=lambda s: s.Position)[-1]
+            last = self._Gradient.Stops[-1]  # stops are kept sorted
             defaultColor = last.Color
 
         newStop = GradientStop(Position=defaultPos, Color=defaultColor, Opacity=defaultOpacity)
@@ -345,33 +363,46 @@ class GradientPanel(QGroupBox):
             stops.append(GradientStop(Position=position, Color=hexColor, Opacity=opacity))
 
         # Sort by position and assign back
-        stops.sort(key=lambda s: s.Position)
+        stops.sort(key=_StopPosition)
         self._Gradient.Stops = stops
 
-        self._UpdatePreview()
+        self._SchedulePreview()
         self.GradientChanged.emit(self._Gradient)
 
     # ------------------------------------------------------------------
     # Preview
     # ------------------------------------------------------------------
 
+    def _SchedulePreview(self) -> None:
+        """Redraw the preview after the current burst of edits."""
+
+        self._PreviewTimer.start()  # restarts if already pending
+
     def _UpdatePreview(self) -> None:
+        self._PreviewTimer.stop()
+
         if self._Gradient is None:
+            self._PreviewKey = None
             self._PreviewBar.setText("No gradient")
             self._PreviewBar.setPixmap(QPixmap())
             return
 
+        # GradientStop is frozen, so the stops tuple is a value snapshot
+        previewKey = (self._Gradient.AngleDeg, tuple(self._Gradient.Stops))
+        if previewKey == self._PreviewKey:
+            return
+
         try:
             width = 256
             height = 32
-            r, g, b, a = ApplyGradient(self._Gradient, width, height)
-            r8, g8, b8 = RgbFloatToUint8(r, g, b)
-            a8 = (np.clip(a, 0.0, 1.0) * 255.0).astype(np.uint8)
-            rgba = np.dstack([r8, g8, b8, a8])
+            t = ComputeGradientTFromAngle(width, height, self._Gradient.AngleDeg)
+            rgba = EvaluateGradientAtU8(self._Gradient, t)
 
             pix = NumpyRgbaToQPixmap(rgba)
             self._PreviewBar.setPixmap(pix)
             self._PreviewBar.setText("")
+            self._PreviewKey = previewKey
         except Exception:
+            self._PreviewKey = None
             self._PreviewBar.setText("Preview error")
             self._PreviewBar.setPixmap(QPixmap())
\ No newline at end of file
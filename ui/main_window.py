@@ -19,7 +19,10 @@ properties) where possible, while respecting Qt's requirements.
 from __future__ import annotations
 
 import sys
-from typing import Optional, Dict
+from collections import OrderedDict
+from dataclasses import astuple
+from pathlib import Path
+from typing import Optional, Dict, Tuple
 
 import numpy as np
 from model.gradient_model import GradientConfig 
@@ -28,7 +31,6 @@ from ui.noise_panel import NoisePanel
 from model.noise_layer import NoiseLayerConfig 
 from ui.lighting_panel import LightingPanel
 from model.lighting_config import LightingConfig
-from core.renderer import RenderImageToPillow
 from ui.export_panel import ExportPanel
 from PySide6.QtWidgets import QFileDialog, QMessageBox
 from PySide6.QtCore import Qt, QThreadPool, QTimer
@@ -53,9 +55,11 @@ try:
     # Project layout imports
     from model.project_config import ProjectConfig
     from workers.render_worker import RenderWorker
+    from workers.export_worker import ExportWorker
 except ImportError:  # pragma: no cover - fallback for flat layout
     from project_config import ProjectConfig  # type: ignore
     from render_worker import RenderWorker  # type: ignore
+    from export_worker import ExportWorker  # type: ignore
 
 
 # ---------------------------------------------------------------------------
@@ -71,14 +75,15 @@ def NumpyRgbaToQPixmap(rgba: np.ndarray) -> QPixmap:
 
     height, width, _ = rgba.shape
 
-    # Create QImage from raw data; copy to detach from NumPy buffer
+    # Wrap the NumPy buffer without copying: QPixmap.fromImage makes its
+    # own copy of the pixels, and the array outlives this call
     image = QImage(
         rgba.data,
         width,
         height,
         rgba.strides[0],  # bytes per line
         QImage.Format_RGBA8888,
-    ).copy()
+    )
 
     return QPixmap.fromImage(image)
 
@@ -97,11 +102,16 @@ def NumpyGrayToQPixmap(gray: np.ndarray) -> QPixmap:
         height,
         gray.strides[0],
         QImage.Format_Grayscale8,
-    ).copy()
+    )
 
     return QPixmap.fromImage(image)
 
 
+# Number of rendered previews kept for instant re-display when the user
+# returns to an earlier parameter set (each is ~2 MB at 960x540).
+PreviewCacheSize = 8
+
+
 # ---------------------------------------------------------------------------
 # MainWindow
 # ---------------------------------------------------------------------------
@@ -114,7 +124,18 @@ class MainWindow(QMainWindow):
         super().__init__(parent)
 
         self.SetWindowTitle("Frost Dune Background Generator")
-        self._ThreadPool = QThreadPool.globalInstance()
+
+        # Persistent single-thread pools owned by the window: one for
+        # previews, one for exports. Threads are created once and kept
+        # alive, jobs of a kind never overlap, and an export does not
+        # queue behind a preview (or vice versa).
+        self._RenderThreadPool = QThreadPool(self)
+        self._RenderThreadPool.setMaxThreadCount(1)
+        self._RenderThreadPool.setExpiryTimeout(-1)
+
+        self._ExportThreadPool = QThreadPool(self)
+        self._ExportThreadPool.setMaxThreadCount(1)
+        self._ExportThreadPool.setExpiryTimeout(-1)
 
         # Project configuration (will later be updated via the UI panels)
         self.ProjectConfig = ProjectConfig.CreateDefaultFrostProject()
@@ -123,6 +144,14 @@ class MainWindow(QMainWindow):
         self._CurrentWorker: Optional[RenderWorker] = None
         self._LastElapsedSeconds: float = 0.0
 
+        # Finished previews keyed by the config values they were rendered
+        # from (see _PreviewKey); most recently used last
+        self._PreviewCache: "OrderedDict[Tuple[str, Tuple[int, int]], Tuple[np.ndarray, Dict[str, np.ndarray]]]" = OrderedDict()
+        self._CurrentPreviewKey: Optional[Tuple[str, Tuple[int, int]]] = None
+
+        # Export worker management (render + PNG encode run off the GUI thread)
+        self._CurrentExportWorker: Optional[ExportWorker] = None
+
         # Status bar timer (optional, in case we want smoother updates later)
         self._ProgressTimer = QTimer(self)
         self._ProgressTimer.setInterval(200)
@@ -144,24 +173,43 @@ class MainWindow(QMainWindow):
         self.ProjectConfig.Lighting = lighting
         pass
     
-    def OnExportRequested(self, width: int, height: int) -> None:
+    def OnExportRequested(self, width: int, height: int, compressLevel: int = 6) -> None:
         # Dateidialog
         path, _ = QFileDialog.getSaveFileName(
             self,
-            "Export PNG",
+            "Export Image",
             "frost_dune_export.png",
-            "PNG Images (*.png)",   
+            "PNG Images (*.png);;JPEG Images (*.jpg *.jpeg)",
         )
         if not path:
             return
 
-        try:
-            img = RenderImageToPillow(self.ProjectConfig, width, height)
-            img.save(path, format="PNG")
-            self._SetStatusText(f"Exported {width} x {height} to {path}")
-        except Exception as ex:
-            QMessageBox.critical(self, "Export Error", str(ex))
-            self._SetStatusText("Export failed")
+        # ExportWorker writes PNG data for anything but .jpg/.jpeg, so
+        # give other names the matching suffix
+        if Path(path).suffix.lower() not in (".png", ".jpg", ".jpeg"):
+            path += ".png"
+
+        if self._CurrentExportWorker is not None:
+            # Already exporting
+            return
+
+        worker = ExportWorker(self.ProjectConfig, path, width, height, compressLevel)
+        self._CurrentExportWorker = worker
+
+        worker.Signals.Finished.connect(self.OnExportFinished)
+        worker.Signals.Failed.connect(self.OnExportFailed)
+
+        self._SetStatusText(f"Exporting {width} x {height}…")
+        self._ExportThreadPool.start(worker)
+
+    def OnExportFinished(self, path: str, width: int, height: int, totalTime: float) -> None:
+        self._CurrentExportWorker = None
+        self._SetStatusText(f"Exported {width} x {height} to {path} ({totalTime:.2f}s)")
+
+    def OnExportFailed(self, message: str) -> None:
+        self._CurrentExportWorker = None
+        QMessageBox.critical(self, "Export Error", message)
+        self._SetStatusText("Export failed")
     
     
     # ------------------------------------------------------------------
@@ -307,6 +355,18 @@ class MainWindow(QMainWindow):
             # Already rendering
             return
 
+        renderWidth, renderHeight = self._PreviewRenderSize()
+        previewKey = (self._PreviewKey(), (renderWidth, renderHeight))
+        cached = self._PreviewCache.get(previewKey)
+        if cached is not None:
+            # Same parameters as an earlier render: show it again
+            self._PreviewCache.move_to_end(previewKey)
+            self._ShowPreviews(*cached)
+            self._SetStatusText("Finished (cached)")
+            return
+
+        self._CurrentPreviewKey = previewKey
+
         self._SetStatusText("Rendering… 0.0s")
         self._GenerateButton.setEnabled(False)
         self._CancelButton.setEnabled(True)
@@ -314,7 +374,7 @@ class MainWindow(QMainWindow):
         self._LastElapsedSeconds = 0.0
         self._ProgressTimer.start()
 
-        worker = RenderWorker(self.ProjectConfig)
+        worker = RenderWorker(self.ProjectConfig, renderWidth, renderHeight)
         self._CurrentWorker = worker
 
         worker.Signals.Started.connect(self.OnRenderStarted)
@@ -322,7 +382,7 @@ class MainWindow(QMainWindow):
         worker.Signals.Finished.connect(self.OnRenderFinished)
         worker.Signals.Canceled.connect(self.OnRenderCanceled)
 
-        self._ThreadPool.start(worker)
+        self._RenderThreadPool.start(worker)
 
     def OnCancelRenderClicked(self) -> None:
         if self._CurrentWorker is not None:
@@ -339,6 +399,51 @@ class MainWindow(QMainWindow):
     def OnRenderFinished(self, finalImage: np.ndarray, noisePreviews: Dict[str, np.ndarray], totalTime: float) -> None:
         self._ProgressTimer.stop()
 
+        if self._CurrentPreviewKey is not None:
+            self._PreviewCache[self._CurrentPreviewKey] = (finalImage, noisePreviews)
+            self._PreviewCache.move_to_end(self._CurrentPreviewKey)
+            while len(self._PreviewCache) > PreviewCacheSize:
+                self._PreviewCache.popitem(last=False)
+            self._CurrentPreviewKey = None
+
+        self._ShowPreviews(finalImage, noisePreviews)
+
+        self._SetStatusText(f"Finished in {totalTime:.2f}s")
+
+        self._GenerateButton.setEnabled(True)
+        self._CancelButton.setEnabled(False)
+        self._CurrentWorker = None
+
+    def _PreviewKey(self) -> str:
+        """Value snapshot of the current config, used as preview cache key.
+
+        The panels edit ProjectConfig in place, so the key is built from
+        the field values (nested dataclasses flattened) rather than from
+        object identity.
+        """
+
+        return repr(astuple(self.ProjectConfig))
+
+    def _PreviewRenderSize(self) -> Tuple[int, int]:
+        """Size to render the main preview at.
+
+        The preview is only ever shown scaled to fit the label, so there
+        is no point rendering more pixels than the label has: the
+        configured preview size is shrunk (keeping its aspect ratio) to
+        the label's device pixels, but never enlarged.
+        """
+
+        width = max(1, int(self.ProjectConfig.PreviewWidth))
+        height = max(1, int(self.ProjectConfig.PreviewHeight))
+
+        pixelRatio = self._PreviewLabel.devicePixelRatioF()
+        labelWidth = max(1, int(self._PreviewLabel.width() * pixelRatio))
+        labelHeight = max(1, int(self._PreviewLabel.height() * pixelRatio))
+
+        scale = min(1.0, labelWidth / width, labelHeight / height)
+        return max(1, round(width * scale)), max(1, round(height * scale))
+
+    def _ShowPreviews(self, finalImage: np.ndarray, noisePreviews: Dict[str, np.ndarray]) -> None:
         # Display main preview
         try:
             pix = NumpyRgbaToQPixmap(finalImage)
@@ -378,14 +483,9 @@ class MainWindow(QMainWindow):
             # If anything goes wrong, silently ignore for now.
             pass
 
-        self._SetStatusText(f"Finished in {totalTime:.2f}s")
-
-        self._GenerateButton.setEnabled(True)
-        self._CancelButton.setEnabled(False)
-        self._CurrentWorker = None
-
     def OnRenderCanceled(self) -> None:
         self._ProgressTimer.stop()
+        self._CurrentPreviewKey = None
         self._SetStatusText("Rendering canceled")
 
         self._GenerateButton.setEnabled(True)
@@ -0,0 +1,123 @@
+"""workers/export_worker.py
+
+Background export worker for the Frost Dune Background Generator.
+
+This module provides a QRunnable-based worker that renders a full
+resolution image and writes it to disk, so neither the render nor the
+PNG encode (zlib) blocks the GUI thread.
+
+Features
+--------
+- Renders the image using core.renderer.
+- Saves it as an optimized progressive JPEG when the path ends in
+  .jpg/.jpeg, and as PNG with a configurable zlib compression level for
+  any other suffix.
+- Emits signals for finished (path, size, elapsed time) and failed.
+
+Conventions
+----------
+- Naming uses a C#-like style (PascalCase for classes, properties, and
+  public methods where possible) while still complying with Qt's
+  expectations (e.g. `run()` method for QRunnable).
+"""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from pathlib import Path
+from time import perf_counter
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+try:
+    # Project layout imports
+    from model.project_config import ProjectConfig
+    from core.renderer import RenderImageToPillow
+except ImportError:  # pragma: no cover - fallback for flat layout / prototyping
+    from project_config import ProjectConfig  # type: ignore
+    from renderer import RenderImageToPillow  # type: ignore
+
+
+# JPEG settings for exports: visually lossless for smooth
+# gradients at a fraction of the PNG size.
+JpegQuality = 85
+
+_JpegSuffixes = (".jpg", ".jpeg")
+
+
+class ExportWorkerSignals(QObject):
+    """Signals used by ExportWorker."""
+
+    Finished = Signal(str, int, int, float)  # path, width, height, totalTime
+    Failed = Signal(str)  # error message
+
+
+class ExportWorker(QRunnable):
+    """Background worker that renders and saves a Frost Dune image.
+
+    Usage (from the GUI layer):
+
+        worker = ExportWorker(projectConfig, path, 1920, 1080)
+        worker.Signals.Finished.connect(...)
+        worker.Signals.Failed.connect(...)
+        exportThreadPool.start(worker)
+
+    MainWindow runs exports on its own single-thread _ExportThreadPool,
+    so an export never queues behind a preview render.
+
+    As with RenderWorker, a deep copy of ProjectConfig is taken on the
+    GUI thread.
+    """
+
+    def __init__(
+        self,
+        projectConfig: "ProjectConfig",
+        path: str,
+        width: int,
+        height: int,
+        compressLevel: int = 6,
+    ) -> None:
+        super().__init__()
+
+        self._ProjectConfig = deepcopy(projectConfig)
+
+        self._Path = str(path)
+        self._Width = int(width)
+        self._Height = int(height)
+        self._CompressLevel = int(compressLevel)
+
+        self.Signals = ExportWorkerSignals()
+
+    # ------------------------------------------------------------------
+    # QRunnable entry point
+    # ------------------------------------------------------------------
+
+    def run(self) -> None:  # noqa: N802  # Qt expects this exact name
+        """Render the image and write it to disk.
+
+        Pillow releases the GIL while encoding, so the GUI stays
+        responsive for the whole job.
+        """
+
+        startTime = perf_counter()
+
+        try:
+            img = RenderImageToPillow(self._ProjectConfig, self._Width, self._Height)
+
+            if Path(self._Path).suffix.lower() in _JpegSuffixes:
+                # JPEG has no alpha channel
+                img.convert("RGB").save(
+                    self._Path,
+                    format="JPEG",
+                    quality=JpegQuality,
+                    optimize=True,
+                    progressive=True,
+                )
+            else:
+                img.save(self._Path, format="PNG", compress_level=self._CompressLevel)
+        except Exception as ex:
+            self.Signals.Failed.emit(str(ex))
+            return
+
+        totalTime = perf_counter() - startTime
+        self.Signals.Finished.emit(self._Path, self._Width, self._Height, float(totalTime))
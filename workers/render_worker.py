@@ -21,7 +21,7 @@ Conventions
 
 from __future__ import annotations
 
-from dataclasses import replace
+from copy import deepcopy
 from time import perf_counter
 from typing import Dict, Optional, Tuple
 
@@ -31,14 +31,30 @@ from PySide6.QtCore import QObject, QRunnable, Signal
 try:
     # Project layout imports
     from model.project_config import ProjectConfig
-    from core.renderer import RenderImageToArrays
+    from core.renderer import RenderImageWithLayerMaps
     from core.heightmap import BuildHeightmapWithLayerMaps
 except ImportError:  # pragma: no cover - fallback for flat layout / prototyping
     from project_config import ProjectConfig  # type: ignore
-    from renderer import RenderImageToArrays  # type: ignore
+    from renderer import RenderImageWithLayerMaps  # type: ignore
     from heightmap import BuildHeightmapWithLayerMaps  # type: ignore
 
 
+def _DownsampleNearest(img: np.ndarray, width: int, height: int) -> np.ndarray:
+    """Nearest-neighbour resize of a 2D map by index sampling.
+
+    Noise previews are purely cosmetic, so picking rows/columns is
+    plenty and avoids any filtering pass.
+    """
+
+    srcHeight, srcWidth = img.shape
+    if (srcWidth, srcHeight) == (width, height):
+        return img
+
+    rows = np.linspace(0, srcHeight - 1, height).round().astype(np.intp)
+    cols = np.linspace(0, srcWidth - 1, width).round().astype(np.intp)
+    return img[rows[:, None], cols[None, :]]
+
+
 class RenderWorkerSignals(QObject):
     """Signals used by RenderWorker.
 
@@ -64,9 +80,9 @@ class RenderWorker(QRunnable):
         worker.Signals.Canceled.connect(...)
         QThreadPool.globalInstance().start(worker)
 
-    A shallow copy of ProjectConfig is stored to reduce the risk of
-    concurrent modification issues, but the GUI should still avoid
-    mutating the config while a render job is running.
+    A deep copy of ProjectConfig is taken in the constructor, i.e. on the
+    GUI thread, so the panels can keep editing the live config (layers,
+    stops, lighting are mutated in place) while the job runs.
     """
 
     def __init__(
@@ -78,10 +94,10 @@ class RenderWorker(QRunnable):
     ) -> None:
         super().__init__()
 
-        # Make a shallow copy of the config to decouple from the GUI's
-        # current instance. This avoids obvious race conditions if the
-        # user tweaks parameters during rendering.
-        self._ProjectConfig = replace(projectConfig)
+        # Snapshot the whole config tree to decouple from the GUI's
+        # current instance: the render thread then only reads its own
+        # copy, even if the user tweaks parameters during rendering.
+        self._ProjectConfig = deepcopy(projectConfig)
 
         self._PreviewWidth = int(previewWidth or projectConfig.PreviewWidth)
         self._PreviewHeight = int(previewHeight or projectConfig.PreviewHeight)
@@ -129,7 +145,7 @@ class RenderWorker(QRunnable):
         # 1. Render main preview image
         # ------------------------------------------------------------------
         try:
-            r8, g8, b8, a8 = RenderImageToArrays(
+            finalImage, layerMaps = RenderImageWithLayerMaps(
                 self._ProjectConfig,
                 self._PreviewWidth,
                 self._PreviewHeight,
@@ -148,9 +164,6 @@ class RenderWorker(QRunnable):
         elapsed = perf_counter() - startTime
         self.Signals.Progress.emit(float(elapsed))
 
-        # Pack RGBA into a single array for easier handling on the GUI side
-        finalImage = np.dstack([r8, g8, b8, a8])
-
         # ------------------------------------------------------------------
         # 2. Optional noise previews (base/detail/combined heightmaps)
         # ------------------------------------------------------------------
@@ -162,14 +175,22 @@ class RenderWorker(QRunnable):
                 noiseWidth = int(self._ProjectConfig.NoisePreviewWidth)
                 noiseHeight = int(self._ProjectConfig.NoisePreviewHeight)
 
-                _, baseMap, detailMap, combinedMap = BuildHeightmapWithLayerMaps(
-                    self._ProjectConfig,
-                    noiseWidth,
-                    noiseHeight,
-                )
+                # Reuse the maps of the main render when they are at least
+                # the noise preview size (downsampling only); a smaller
+                # render would be upsampled into blocky previews, so the
+                # maps are then built at the noise preview size.
+                if self._PreviewWidth >= noiseWidth and self._PreviewHeight >= noiseHeight:
+                    baseMap, detailMap, combinedMap = layerMaps
+                else:
+                    _, baseMap, detailMap, combinedMap = BuildHeightmapWithLayerMaps(
+                        self._ProjectConfig,
+                        noiseWidth,
+                        noiseHeight,
+                    )
 
                 # Convert normalized [0, 1] maps to uint8 grayscale
                 def ToGray(img: np.ndarray) -> np.ndarray:
+                    img = _DownsampleNearest(img, noiseWidth, noiseHeight)
                     return (np.clip(img, 0.0, 1.0) * 255.0).astype(np.uint8)
 
                 noisePreviews = {